@@ -0,0 +1,28 @@
+"""added chat_message chat_id, created_at index
+
+Revision ID: 3b7d52c4e1f9
+Revises: 8c3e1f0b9a27
+Create Date: 2026-10-16 11:03:47.520931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7d52c4e1f9'
+down_revision: Union[str, Sequence[str], None] = '8c3e1f0b9a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_chat_message_chat_created', 'chat_message_table', ['chat_id', sa.text('created_at DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_chat_message_chat_created', table_name='chat_message_table')
@@ -0,0 +1,32 @@
+"""added feed and engagement indexes
+
+Revision ID: 5e91c0d7a4b2
+Revises: 3b7d52c4e1f9
+Create Date: 2026-10-16 13:21:09.842615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e91c0d7a4b2'
+down_revision: Union[str, Sequence[str], None] = '3b7d52c4e1f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_feed_author_created', 'feed_table', ['author_id', 'created_at'], unique=False)
+    op.create_index('ix_feed_parent_created', 'feed_table', ['parent_id', 'created_at'], unique=False)
+    op.create_index('ix_engagement_feed_type', 'engagement_table', ['feed_id', 'engagement_type'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_engagement_feed_type', table_name='engagement_table')
+    op.drop_index('ix_feed_parent_created', table_name='feed_table')
+    op.drop_index('ix_feed_author_created', table_name='feed_table')
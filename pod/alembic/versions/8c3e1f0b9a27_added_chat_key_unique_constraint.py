@@ -0,0 +1,41 @@
+"""added chat_key unique constraint
+
+Revision ID: 8c3e1f0b9a27
+Revises: f2e06ec35aeb
+Create Date: 2026-10-16 10:12:04.118342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3e1f0b9a27'
+down_revision: Union[str, Sequence[str], None] = 'f2e06ec35aeb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('chat_table', sa.Column('chat_key', sa.String(length=65), nullable=True))
+    op.execute(
+        """
+        UPDATE chat_table SET chat_key = keys.chat_key
+        FROM (
+            SELECT chat_id, string_agg(replace(user_id::text, '-', ''), ':' ORDER BY replace(user_id::text, '-', '')) AS chat_key
+            FROM chat_participant_table
+            GROUP BY chat_id
+        ) AS keys
+        WHERE chat_table.id = keys.chat_id
+        """
+    )
+    op.create_unique_constraint('uq_chat_key', 'chat_table', ['chat_key'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_chat_key', 'chat_table', type_='unique')
+    op.drop_column('chat_table', 'chat_key')
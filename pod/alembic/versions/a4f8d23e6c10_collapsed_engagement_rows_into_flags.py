@@ -0,0 +1,81 @@
+"""collapsed engagement rows into flags
+
+Revision ID: a4f8d23e6c10
+Revises: 5e91c0d7a4b2
+Create Date: 2026-10-16 14:02:36.117904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f8d23e6c10'
+down_revision: Union[str, Sequence[str], None] = '5e91c0d7a4b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+engagement_type = sa.Enum('feeds', 'reposts', 'quotes', 'likes', 'views', 'bookmarks', name='engagement_type')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('engagement_table', sa.Column('reposted', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('engagement_table', sa.Column('liked', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('engagement_table', sa.Column('bookmarked', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('engagement_table', sa.Column('viewed_at', sa.TIMESTAMP(timezone=True), nullable=True))
+    op.execute(
+        """
+        UPDATE engagement_table SET reposted = agg.reposted, liked = agg.liked, bookmarked = agg.bookmarked, viewed_at = agg.viewed_at
+        FROM (
+            SELECT min(id::text)::uuid AS keep_id,
+                   bool_or(engagement_type = 'reposts') AS reposted,
+                   bool_or(engagement_type = 'likes') AS liked,
+                   bool_or(engagement_type = 'bookmarks') AS bookmarked,
+                   max(created_at) FILTER (WHERE engagement_type = 'views') AS viewed_at
+            FROM engagement_table
+            GROUP BY user_id, feed_id
+        ) AS agg
+        WHERE engagement_table.id = agg.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM engagement_table
+        WHERE id NOT IN (SELECT min(id::text)::uuid FROM engagement_table GROUP BY user_id, feed_id)
+           OR NOT (reposted OR liked OR bookmarked OR viewed_at IS NOT NULL)
+        """
+    )
+    op.drop_index('ix_engagement_feed_type', table_name='engagement_table')
+    op.drop_constraint('uq_feed_engagement', 'engagement_table', type_='unique')
+    op.drop_column('engagement_table', 'engagement_type')
+    engagement_type.drop(op.get_bind(), checkfirst=True)
+    op.create_unique_constraint('uq_feed_engagement', 'engagement_table', ['user_id', 'feed_id'])
+    op.create_index('ix_engagement_feed', 'engagement_table', ['feed_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_engagement_feed', table_name='engagement_table')
+    op.drop_constraint('uq_feed_engagement', 'engagement_table', type_='unique')
+    engagement_type.create(op.get_bind(), checkfirst=True)
+    op.add_column('engagement_table', sa.Column('engagement_type', engagement_type, nullable=True))
+    op.execute(
+        """
+        INSERT INTO engagement_table (id, user_id, feed_id, engagement_type, created_at, updated_at)
+        SELECT gen_random_uuid(), e.user_id, e.feed_id, kinds.kind::engagement_type, e.created_at, e.updated_at
+        FROM engagement_table AS e
+        CROSS JOIN LATERAL (VALUES ('reposts', e.reposted), ('likes', e.liked), ('bookmarks', e.bookmarked), ('views', e.viewed_at IS NOT NULL)) AS kinds(kind, flag)
+        WHERE kinds.flag AND e.engagement_type IS NULL
+        """
+    )
+    op.execute("DELETE FROM engagement_table WHERE engagement_type IS NULL")
+    op.alter_column('engagement_table', 'engagement_type', nullable=False)
+    op.drop_column('engagement_table', 'viewed_at')
+    op.drop_column('engagement_table', 'bookmarked')
+    op.drop_column('engagement_table', 'liked')
+    op.drop_column('engagement_table', 'reposted')
+    op.create_unique_constraint('uq_feed_engagement', 'engagement_table', ['user_id', 'feed_id', 'engagement_type'])
+    op.create_index('ix_engagement_feed_type', 'engagement_table', ['feed_id', 'engagement_type'], unique=False)
@@ -0,0 +1,35 @@
+"""converted report_reason to varchar
+
+Revision ID: c7b3e94f1d58
+Revises: a4f8d23e6c10
+Create Date: 2026-10-16 14:48:52.603117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7b3e94f1d58'
+down_revision: Union[str, Sequence[str], None] = 'a4f8d23e6c10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+report_reasons = ('copyright_infringement', 'spam', 'nudity_or_sexual_content', 'misinformation', 'harassment_or_bullying', 'hate_speech', 'violence_or_threats', 'self_harm_or_suicide', 'impersonation', 'other')
+report_reason = sa.Enum(*report_reasons, name='report_reason')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('report_table', 'report_reason', type_=sa.String(length=32), existing_nullable=False, postgresql_using='report_reason::text')
+    report_reason.drop(op.get_bind(), checkfirst=True)
+    op.create_check_constraint('report_reason', 'report_table', sa.column('report_reason').in_(report_reasons))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('report_reason', 'report_table', type_='check')
+    report_reason.create(op.get_bind(), checkfirst=True)
+    op.alter_column('report_table', 'report_reason', type_=report_reason, existing_nullable=False, postgresql_using='report_reason::report_reason')
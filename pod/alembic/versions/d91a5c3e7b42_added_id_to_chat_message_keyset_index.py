@@ -0,0 +1,30 @@
+"""added id to chat_message keyset index
+
+Revision ID: d91a5c3e7b42
+Revises: c7b3e94f1d58
+Create Date: 2026-10-16 16:12:05.318274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91a5c3e7b42'
+down_revision: Union[str, Sequence[str], None] = 'c7b3e94f1d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_chat_message_chat_created', table_name='chat_message_table')
+    op.create_index('ix_chat_message_chat_created', 'chat_message_table', ['chat_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_chat_message_chat_created', table_name='chat_message_table')
+    op.create_index('ix_chat_message_chat_created', 'chat_message_table', ['chat_id', sa.text('created_at DESC')], unique=False)
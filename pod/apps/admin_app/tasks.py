@@ -1,5 +1,7 @@
-from settings.my_redis import pubsub_manager
+from settings.my_redis import cache_manager, pubsub_manager
+from utility.my_enums import PubSubTopics
 
 
 async def broadcast_updated_statistics() -> None:
-    await pubsub_manager.publish(topic="statistics", data={})
+    statistics = await cache_manager.get_statistics()
+    await pubsub_manager.publish(topic=PubSubTopics.SETTINGS_STATS.value, data=statistics.model_dump())
@@ -1,4 +1,5 @@
 import asyncio
+from typing import Optional
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from redis.asyncio.client import PubSub
@@ -14,7 +15,7 @@ admin_ws_router = APIRouter()
 @admin_ws_router.websocket(path="/metrics")
 async def admin_statistics_websocket(websocket: WebSocket):
     await admin_ws_manager.connect(websocket=websocket)
-    print("🚧 Client connected")
+    my_logger.debug("Client connected")
 
     statistics = await cache_manager.get_statistics()
     await admin_ws_manager.broadcast(data=statistics.model_dump())
@@ -35,27 +36,30 @@ async def settings_statistics_websocket(websocket: WebSocket):
     my_logger.info("🚧 Client connected")
 
     statistics: StatisticsSchema = await cache_manager.get_statistics()
-    my_logger.info(f"🚧 statistics: {statistics}")
-    pubsub: PubSub = await pubsub_manager.subscribe(topic=PubSubTopics.SETTINGS_STATS.value)
-    await settings_ws_manager.broadcast(data=statistics.model_dump())
-
-    async def listen_pubsub():
-        my_logger.debug("📡 Subscribed and listening to 'settings:stats'...")
-        while True:
-            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-            if message:
-                my_logger.debug(f"message: {message}, type: {type(message)}")
-                if message["type"] == "message":
-                    updated_statistics = await cache_manager.get_statistics()
-                    my_logger.debug(f"updated_statistics: {updated_statistics}")
-                    await websocket.send_json(updated_statistics.model_dump())
-
-    listener_task = asyncio.create_task(listen_pubsub())
+    await websocket.send_json(statistics.model_dump())
 
     try:
         while True:
             await websocket.receive_text()
     except WebSocketDisconnect:
-        listener_task.cancel()
-        await pubsub.close()
         await settings_ws_manager.disconnect(websocket=websocket)
+
+
+async def statistics_fanout():
+    """Single process-wide subscriber that forwards the already serialized statistics to every settings websocket."""
+    topic = PubSubTopics.SETTINGS_STATS.value
+    pubsub: PubSub = await pubsub_manager.subscribe(topic=topic)
+    my_logger.debug("📡 Subscribed and listening to '{}'...", topic)
+
+    try:
+        while True:
+            # Same loop as the per-connection listener: the timeout bounds each call so cancellation lands promptly without busy-spinning
+            message: Optional[dict] = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            if message is None or message["type"] != "message":
+                continue
+            await settings_ws_manager.broadcast_text(payload=message["data"])
+    except asyncio.CancelledError:
+        my_logger.debug("Statistics fanout cancelled")
+    finally:
+        # Unsubscribes and closes the pubsub connection when the lifespan cancels this task
+        await pubsub_manager.unsubscribe(topic=topic)
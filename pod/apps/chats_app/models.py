@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import ARRAY, TIMESTAMP, Enum, ForeignKey, String, Text, UniqueConstraint, func, select, text
+from sqlalchemy import ARRAY, TIMESTAMP, Enum, ForeignKey, Index, String, Text, UniqueConstraint, func, select, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
@@ -42,14 +42,19 @@ class GroupModel(BaseModel):
     group_type: Mapped["GroupType"] = mapped_column(Enum(GroupType, name="group_type"), default=GroupType.public)
     last_message_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
     group_messages: Mapped[list["GroupMessageModel"]] = relationship(back_populates="group", passive_deletes=True)
-    group_participants: Mapped[list["GroupParticipantModel"]] = relationship(argument="GroupParticipantModel", back_populates="group", cascade="all, delete-orphan")
+    group_participants: Mapped[list["GroupParticipantModel"]] = relationship(argument="GroupParticipantModel", back_populates="group", cascade="all, delete-orphan", passive_deletes=True)
     users: Mapped[list["UserModel"]] = relationship(secondary="group_participant_table", back_populates="groups", viewonly=True)
-    members_count: Mapped[int] = column_property(select(func.count(GroupParticipantModel.id)).where(text("group_id = id")).scalar_subquery())
+    # Deferred so plain group SELECTs don't carry three correlated subqueries; load with undefer_group("counts") where needed.
+    members_count: Mapped[int] = column_property(select(func.count(GroupParticipantModel.id)).where(text("group_id = id")).scalar_subquery(), deferred=True, group="counts")
     administrators_count: Mapped[int] = column_property(
-        select(func.count(GroupParticipantModel.id)).where(text("group_id = id")).where(GroupParticipantModel.member_type == MemberType.administrator).scalar_subquery()
+        select(func.count(GroupParticipantModel.id)).where(text("group_id = id")).where(GroupParticipantModel.member_type == MemberType.administrator).scalar_subquery(),
+        deferred=True,
+        group="counts",
     )
     moderators_count: Mapped[int] = column_property(
-        select(func.count(GroupParticipantModel.id)).where(text("group_id = id")).where(GroupParticipantModel.member_type == MemberType.moderator).scalar_subquery()
+        select(func.count(GroupParticipantModel.id)).where(text("group_id = id")).where(GroupParticipantModel.member_type == MemberType.moderator).scalar_subquery(),
+        deferred=True,
+        group="counts",
     )
 
 
@@ -72,14 +77,17 @@ class ChatParticipantModel(BaseModel):
 
 class ChatModel(BaseModel):
     __tablename__ = "chat_table"
+    __table_args__ = (UniqueConstraint("chat_key", name="uq_chat_key"),)
+    chat_key: Mapped[Optional[str]] = mapped_column(String(length=65), nullable=True)
     last_message_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
-    chat_participants: Mapped[list["ChatParticipantModel"]] = relationship(argument="ChatParticipantModel", back_populates="chat", cascade="all, delete-orphan")
-    chat_messages: Mapped[list["ChatMessageModel"]] = relationship(argument="ChatMessageModel", back_populates="chat", cascade="all, delete-orphan")
+    chat_participants: Mapped[list["ChatParticipantModel"]] = relationship(argument="ChatParticipantModel", back_populates="chat", cascade="all, delete-orphan", passive_deletes=True)
+    chat_messages: Mapped[list["ChatMessageModel"]] = relationship(argument="ChatMessageModel", back_populates="chat", cascade="all, delete-orphan", passive_deletes=True)
     users: Mapped[list["UserModel"]] = relationship(secondary="chat_participant_table", back_populates="chats", viewonly=True)
 
 
 class ChatMessageModel(MessageBaseModel):
     __tablename__ = "chat_message_table"
+    __table_args__ = (Index("ix_chat_message_chat_created", "chat_id", text("created_at DESC"), text("id DESC")),)
     chat_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), ForeignKey(column="chat_table.id", ondelete="CASCADE"))
     chat: Mapped["ChatModel"] = relationship(argument="ChatModel", back_populates="chat_messages", passive_deletes=True)
     sender: Mapped["UserModel"] = relationship(argument="UserModel", back_populates="chat_messages", passive_deletes=True)
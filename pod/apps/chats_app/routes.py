@@ -2,9 +2,10 @@ from datetime import datetime, UTC
 from typing import Optional
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter
-from sqlalchemy import select, exists, func
-from sqlalchemy.orm import selectinload
+from fastapi import APIRouter, Response
+from sqlalchemy import Insert, Integer, bindparam, column, delete, func, lambda_stmt, literal, select, true, tuple_, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from apps.chats_app.models import ChatModel, ChatMessageModel, ChatParticipantModel
 from apps.chats_app.schemas import ChatResponseSchema, CreateMessageSchema, ChatSchema, ParticipantSchema, ChatMessageResponseSchema, ChatMessageSchema
@@ -12,168 +13,204 @@ from apps.users_app.schemas import ResultSchema
 from settings.my_database import DBSession
 from settings.my_dependency import strictJwtDependency
 from settings.my_exceptions import ApiException
-from settings.my_redis import chat_cache_manager, cache_manager, pubsub_manager
+from settings.my_redis import chat_cache_manager, pubsub_manager
 from utility.my_logger import my_logger
+from utility.orjson_response import ORJSONResponse, orjson_dumps
 
 chats_router = APIRouter()
 
+_PROFILE_FIELDS = ("name", "username", "avatar_url", "last_seen_at")
+
+# Hot statements are built once at import time; handlers only pass bound values, so SQLAlchemy skips construction and cache-key generation per request
+_CHAT_PARTICIPANT_IDS_STMT = lambda_stmt(lambda: select(ChatParticipantModel.user_id).where(ChatParticipantModel.chat_id == bindparam("chat_id")))
+_DELETE_CHAT_STMT = lambda_stmt(lambda: delete(ChatModel).where(ChatModel.id == bindparam("chat_id")))
+_MESSAGES_PAGE_STMT = lambda_stmt(
+    lambda: select(
+        ChatMessageModel.id, ChatMessageModel.chat_id, ChatMessageModel.sender_id, ChatMessageModel.message, ChatMessageModel.created_at, func.count().over().label("total")
+    )
+    .where(ChatMessageModel.chat_id == bindparam("chat_id"))
+    .order_by(ChatMessageModel.created_at.desc(), ChatMessageModel.id.desc())
+    .offset(bindparam("offset", type_=Integer))
+    .limit(bindparam("limit", type_=Integer))
+)
+_MESSAGES_BEFORE_STMT = lambda_stmt(
+    lambda: select(
+        ChatMessageModel.id, ChatMessageModel.chat_id, ChatMessageModel.sender_id, ChatMessageModel.message, ChatMessageModel.created_at, func.count().over().label("total")
+    )
+    .where(
+        ChatMessageModel.chat_id == bindparam("chat_id"),
+        tuple_(ChatMessageModel.created_at, ChatMessageModel.id) < tuple_(bindparam("before"), bindparam("before_id")),
+    )
+    .order_by(ChatMessageModel.created_at.desc(), ChatMessageModel.id.desc())
+    .limit(bindparam("limit", type_=Integer))
+)
+
+
+def _profile_fields(profile: dict) -> tuple[Optional[str], ...]:
+    """Unpack the cached profile hash once as (name, username, avatar_url, last_seen_at)."""
+    return tuple(map(profile.get, _PROFILE_FIELDS))
+
+
+def _create_chat_statement(chat_id: UUID, message_id: UUID, user_id: UUID, participant_id: UUID, message: str, now: datetime) -> Insert:
+    """Create chat, participants and first message in one statement; returns no row if the chat_key already exists."""
+    chat_key = ":".join(sorted([user_id.hex, participant_id.hex]))
+
+    new_chat = (
+        insert(ChatModel)
+        .values(id=chat_id, chat_key=chat_key, last_message_at=now, created_at=now, updated_at=now)
+        .on_conflict_do_nothing(index_elements=[ChatModel.chat_key])
+        .returning(ChatModel.id)
+        .cte("new_chat")
+    )
+
+    participants = values(column("id", PG_UUID(as_uuid=True)), column("user_id", PG_UUID(as_uuid=True)), name="participants").data([(uuid4(), user_id), (uuid4(), participant_id)])
+    new_participants = (
+        insert(ChatParticipantModel)
+        .from_select(
+            ["id", "chat_id", "user_id", "created_at", "updated_at"],
+            select(participants.c.id, new_chat.c.id, participants.c.user_id, literal(now), literal(now)).select_from(new_chat).join(participants, true()),
+        )
+        .cte("new_participants")
+    )
+
+    return (
+        insert(ChatMessageModel)
+        .from_select(
+            ["id", "chat_id", "sender_id", "message", "created_at", "updated_at"],
+            select(literal(message_id, PG_UUID(as_uuid=True)), new_chat.c.id, literal(user_id, PG_UUID(as_uuid=True)), literal(message), literal(now), literal(now)),
+        )
+        .add_cte(new_participants)
+        .returning(ChatMessageModel.chat_id)
+    )
+
 
 @chats_router.post(path="/messages/create", response_model=ChatSchema, status_code=200)
 async def create_chat_route(jwt: strictJwtDependency, session: DBSession, schema: CreateMessageSchema, participant_id: UUID):
-    try:
-        if jwt.user_id == participant_id:
-            raise ApiException(status_code=400, detail="Cannot create chat with self")
-
-        exists_stmt = (
-            select(ChatParticipantModel.chat_id)
-            .where(ChatParticipantModel.user_id.in_([jwt.user_id, participant_id]))
-            .group_by(ChatParticipantModel.chat_id)
-            .having(func.count() > 1)
-        )
-        is_chat_exist = await session.scalar(select(exists(exists_stmt)))
-        if is_chat_exist:
-            raise ApiException(status_code=403, detail="Chat already exist.")
-
-        chat_id = uuid4()
-        message_id = uuid4()
-        now = datetime.now(UTC)
-        now_timestamp = int(now.timestamp())
-
-        chat = ChatModel(id=chat_id, last_message_at=now)
-        sender = ChatParticipantModel(chat_id=chat_id, user_id=jwt.user_id)
-        receiver = ChatParticipantModel(chat_id=chat_id, user_id=participant_id)
-        message = ChatMessageModel(id=message_id, chat_id=chat_id, sender_id=jwt.user_id, message=schema.message)
-        session.add_all([chat, sender, receiver, message])
-        await session.commit()
-
-        participant_profile = await cache_manager.get_profile(participant_id.hex)
-        if not participant_profile:
-            raise ApiException(400, "Participant profile not found")
-
-        mapping = {
-            "id": chat_id.hex,
-            "last_activity_at": now_timestamp,
-            "last_message": {"id": message_id.hex, "chat_id": chat_id.hex, "sender_id": jwt.user_id.hex, "message": schema.message, "created_at": now_timestamp}
+    if jwt.user_id == participant_id:
+        raise ApiException(status_code=400, detail="Cannot create chat with self")
+
+    chat_id = uuid4()
+    message_id = uuid4()
+    now = datetime.now(UTC)
+    now_timestamp = int(now.timestamp())
+
+    stmt = _create_chat_statement(chat_id=chat_id, message_id=message_id, user_id=jwt.user_id, participant_id=participant_id, message=schema.message, now=now)
+    created_chat_id: Optional[UUID] = await session.scalar(stmt)
+    if created_chat_id is None:
+        raise ApiException(status_code=403, detail="Chat already exist.")
+    await session.commit()
+
+    mapping = {
+        "id": chat_id.hex,
+        "last_activity_at": now_timestamp,
+        "last_message": {"id": message_id.hex, "chat_id": chat_id.hex, "sender_id": jwt.user_id.hex, "message": schema.message, "created_at": now_timestamp}
+    }
+    participant_profile, user_profile, is_online = await chat_cache_manager.create_chat(user_id=jwt.user_id.hex, participant_id=participant_id.hex, chat_id=chat_id.hex, mapping=mapping)
+    if not participant_profile:
+        raise ApiException(400, "Participant profile not found")
+
+    name, username, avatar_url, last_seen_at = _profile_fields(participant_profile)
+
+    # Every value here was just written to the DB or read from our own cache, so skip validation
+    response = ChatSchema.model_construct(
+        id=chat_id,
+        participant=ParticipantSchema.model_construct(
+            id=participant_id,
+            name=name,
+            username=username,
+            avatar_url=avatar_url,
+            last_seen_at=datetime.fromtimestamp(int(last_seen_at)) if last_seen_at is not None else None,
+            is_online=is_online
+        ),
+        last_activity_at=now,
+        last_message=ChatMessageSchema.model_construct(id=message_id, chat_id=chat_id, sender_id=jwt.user_id, message=schema.message, created_at=now)
+    )
+
+    if is_online and user_profile:
+        name, username, avatar_url, _ = _profile_fields(user_profile)
+        data = {
+            **mapping,
+            "participant": {
+                "id": jwt.user_id.hex,
+                "name": name,
+                "username": username,
+                "avatar_url": avatar_url,
+                "last_seen_at": now_timestamp,
+                "is_online": True,
+            }
         }
-        await chat_cache_manager.create_chat(user_id=jwt.user_id.hex, participant_id=participant_id.hex, chat_id=chat_id.hex, mapping=mapping)
-
-        is_online = await chat_cache_manager.is_online(participant_id=participant_id.hex)
-
-        response = ChatSchema(
-            id=chat_id,
-            participant=ParticipantSchema(
-                id=participant_id,
-                name=participant_profile.get("name"),
-                username=participant_profile.get("username"),
-                avatar_url=participant_profile.get("avatar_url"),
-                last_seen_at=datetime.fromtimestamp(int(participant_profile.get("last_seen_at"))) if "last_seen_at" in participant_profile else None,
-                is_online=is_online
-            ),
-            last_activity_at=now,
-            last_message=ChatMessageSchema(id=message_id, chat_id=chat_id, sender_id=jwt.user_id, message=schema.message, created_at=now)
-        )
+        await pubsub_manager.publish(topic=f"chats:home:{participant_id.hex}", data=data)
 
-        if is_online:
-            participant_profile = await cache_manager.get_profile(jwt.user_id.hex)
-
-            data = {
-                **mapping,
-                "participant": {
-                    "id": jwt.user_id.hex,
-                    "name": participant_profile.get("name"),
-                    "username": participant_profile.get("username"),
-                    "avatar_url": participant_profile.get("avatar_url"),
-                    "last_seen_at": now_timestamp,
-                    "is_online": True,
-                }
-            }
-            await pubsub_manager.publish(topic=f"chats:home:{participant_id.hex}", data=data)
+    return ORJSONResponse(content=response.model_dump(mode="json"))
 
-        return response
-    except Exception as e:
-        my_logger.exception(f"Exception e: {e}")
-        raise ApiException(status_code=500, detail=f"Something went wrong while creating chat: {e}")
 
+async def _delete_chat(user_id: UUID, session: AsyncSession, chat_id: UUID) -> ORJSONResponse:
+    is_user_chat_owner: bool = await chat_cache_manager.is_user_chat_owner(user_id=user_id.hex, chat_id=chat_id.hex)
+    if not is_user_chat_owner:
+        raise ApiException(status_code=403, detail="Chat does not belong to you")
 
-@chats_router.delete(path="/delete", response_model=ResultSchema, status_code=200)
-async def delete_chat_route(jwt: strictJwtDependency, session: DBSession, chat_id: UUID):
-    try:
-        is_user_chat_owner: bool = await chat_cache_manager.is_user_chat_owner(user_id=jwt.user_id.hex, chat_id=chat_id.hex)
-        if not is_user_chat_owner:
-            raise ApiException(status_code=403, detail="Chat does not belong to you")
+    user_ids = (await session.scalars(_CHAT_PARTICIPANT_IDS_STMT, {"chat_id": chat_id})).all()
+    if not user_ids:
+        return ORJSONResponse(content={"ok": False})
 
-        stmt = select(ChatModel).options(selectinload(ChatModel.chat_participants)).where(ChatModel.id == chat_id)
-        result = await session.execute(stmt)
-        chat: Optional[ChatModel] = result.scalar_one_or_none()
-        if not chat:
-            return {"ok": False}
+    await chat_cache_manager.delete_chat(participants=[uid.hex for uid in user_ids], chat_id=chat_id.hex)
+    await session.execute(_DELETE_CHAT_STMT, {"chat_id": chat_id})
+    await session.commit()
 
-        await chat_cache_manager.delete_chat(participants=[pid.user_id.hex for pid in chat.chat_participants], chat_id=chat_id.hex)
-        await session.delete(instance=chat)
-        await session.commit()
+    return ORJSONResponse(content={"ok": True})
 
-        return {"ok": True}
-    except Exception as e:
-        my_logger.exception(f"Exception e: {e}")
-        raise ApiException(status_code=400, detail=f"Something went wrong while getting chat tiles, e: {e}")
+
+@chats_router.delete(path="/delete", response_model=ResultSchema, status_code=200)
+async def delete_chat_route(jwt: strictJwtDependency, session: DBSession, chat_id: UUID):
+    return await _delete_chat(user_id=jwt.user_id, session=session, chat_id=chat_id)
 
 
 @chats_router.get(path="", response_model=ChatResponseSchema, status_code=200)
 async def get_chats_route(jwt: strictJwtDependency, start: int = 0, end: int = 20):
-    try:
-        response: ChatResponseSchema = await chat_cache_manager.get_chats(user_id=jwt.user_id.hex, start=start, end=end)
-        my_logger.debug(f"length of response.chats: {len(response.chats)}, response.end: {response.end}")
-        return response
-    except Exception as e:
-        my_logger.exception(f"Exception e: {e}")
-        raise ApiException(status_code=400, detail=f"Something went wrong while getting chat tiles, e: {e}")
-
+    # Serialized page is cached for a few seconds; create/delete/new message drop it for every participant
+    cached: Optional[str] = await chat_cache_manager.get_cached_chats(user_id=jwt.user_id.hex, start=start, end=end)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-@chats_router.get(path="/messages", response_model=ChatMessageResponseSchema, status_code=200)
-async def get_chat_messages_route(_: strictJwtDependency, session: DBSession, chat_id: UUID, start: int = 0, end: int = 20):
-    try:
-        my_logger.warning("1")
-        count_stmt = select(func.count()).where(ChatMessageModel.chat_id == chat_id)
-        count_result = await session.execute(count_stmt)
-        total_messages = count_result.scalar_one()
-
-        my_logger.warning("2")
-        if total_messages:
-            return {"messages": [], "end": 0}
+    response: ChatResponseSchema = await chat_cache_manager.get_chats(user_id=jwt.user_id.hex, start=start, end=end)
+    my_logger.debug("length of response.chats: {}, response.end: {}", len(response.chats), response.end)
+    content: bytes = orjson_dumps(response.model_dump(mode="json"))
+    await chat_cache_manager.set_cached_chats(user_id=jwt.user_id.hex, start=start, end=end, payload=content)
+    return Response(content=content, media_type="application/json")
 
-        my_logger.warning("3")
 
-        stmt = (select(ChatMessageModel).where(ChatMessageModel.chat_id == chat_id).order_by(ChatMessageModel.created_at.desc()).offset(start).limit(end - start))
-        result = await session.scalars(stmt)
-        messages: list[ChatMessageModel] = result.all()
-        my_logger.warning("4")
-
-        response = ChatMessageResponseSchema(messages=[ChatMessageSchema.model_validate(obj=message) for message in messages], end=total_messages - 1)
-        my_logger.warning("5")
-        return response
-    except Exception as e:
-        my_logger.exception(f"Exception e: {e}")
-        raise ApiException(status_code=400, detail=f"Something went wrong while getting chat tiles, e: {e}")
+@chats_router.get(path="/messages", response_model=ChatMessageResponseSchema, status_code=200)
+async def get_chat_messages_route(
+    _: strictJwtDependency, session: DBSession, chat_id: UUID, start: int = 0, end: int = 20, before: Optional[datetime] = None, before_id: Optional[UUID] = None
+):
+    # Keyset pagination on (created_at, id): pass back the previous page's cursor and the index range scan replaces OFFSET.
+    # created_at in messages is whole seconds, so the cursor carries the full-precision timestamp and the id breaks ties.
+    if (before is None) != (before_id is None):
+        raise ApiException(status_code=400, detail="before and before_id must be given together")
+
+    if before is not None:
+        result = await session.execute(_MESSAGES_BEFORE_STMT, {"chat_id": chat_id, "before": before, "before_id": before_id, "limit": end - start})
+    else:
+        result = await session.execute(_MESSAGES_PAGE_STMT, {"chat_id": chat_id, "offset": start, "limit": end - start})
+    rows = result.all()
+
+    if not rows:
+        return ORJSONResponse(content={"messages": [], "end": start, "cursor": None})
+
+    total_messages: int = rows[0].total
+    oldest = rows[-1]
+
+    # Plain rows straight into orjson: no ORM objects and no Pydantic validation per message
+    content = {
+        "messages": [
+            {"id": row.id.hex, "chat_id": row.chat_id.hex, "sender_id": row.sender_id.hex, "message": row.message, "created_at": row.created_at} for row in rows
+        ],
+        "end": total_messages - 1,
+        "cursor": {"before": oldest.created_at.isoformat(), "before_id": oldest.id.hex},
+    }
+    return ORJSONResponse(content=content)
 
 
 @chats_router.delete(path="/messages/delete", response_model=ResultSchema, status_code=200)
 async def delete_chat_message_route(jwt: strictJwtDependency, session: DBSession, _message_id: UUID, chat_id: UUID):
-    try:
-        is_user_chat_owner: bool = await chat_cache_manager.is_user_chat_owner(user_id=jwt.user_id.hex, chat_id=chat_id.hex)
-        if not is_user_chat_owner:
-            raise ApiException(status_code=403, detail="Chat does not belong to you")
-
-        stmt = select(ChatModel).options(selectinload(ChatModel.chat_participants)).where(ChatModel.id == chat_id)
-        result = await session.execute(stmt)
-        chat: Optional[ChatModel] = result.scalar_one_or_none()
-        if not chat:
-            return {"ok": False}
-
-        await chat_cache_manager.delete_chat(participants=[pid.user_id.hex for pid in chat.chat_participants], chat_id=chat_id.hex)
-        await session.delete(instance=chat)
-        await session.commit()
-
-        return {"ok": True}
-    except Exception as e:
-        my_logger.exception(f"Exception e: {e}")
-        raise ApiException(status_code=400, detail=f"Something went wrong while getting chat tiles, e: {e}")
+    return await _delete_chat(user_id=jwt.user_id, session=session, chat_id=chat_id)
@@ -1,48 +1,49 @@
 from datetime import datetime
 from typing import Optional
-from uuid import UUID
 
 from pydantic import BaseModel
 
+from utility.my_types import HexUUID, UnixTs
+
+
+# CreateMessageSchema is validated client input; the rest are response DTOs that routes and the cache build with model_construct
+
 
 class CreateMessageSchema(BaseModel):
     message: str
 
 
 class ParticipantSchema(BaseModel):
-    id: UUID
+    id: HexUUID
     name: str
     username: str
     avatar_url: Optional[str] = None
-    last_seen_at: Optional[datetime] = None
+    last_seen_at: Optional[UnixTs] = None
     is_online: bool = False
 
     class Config:
         from_attributes = True
-        json_encoders = {UUID: lambda v: v.hex, datetime: lambda v: int(v.timestamp()) if v is not None else None}
 
 
 class ChatMessageSchema(BaseModel):
-    id: UUID
-    sender_id: UUID
-    chat_id: UUID
+    id: HexUUID
+    sender_id: HexUUID
+    chat_id: HexUUID
     message: str
-    created_at: datetime
+    created_at: UnixTs
 
     class Config:
         from_attributes = True
-        json_encoders = {UUID: lambda v: v.hex, datetime: lambda v: int(v.timestamp())}
 
 
 class ChatSchema(BaseModel):
-    id: UUID
+    id: HexUUID
     participant: ParticipantSchema
     last_message: Optional[ChatMessageSchema] = None
-    last_activity_at: datetime
+    last_activity_at: UnixTs
 
     class Config:
         from_attributes = True
-        json_encoders = {UUID: lambda v: v.hex, datetime: lambda v: int(v.timestamp())}
 
 
 class ChatResponseSchema(BaseModel):
@@ -50,10 +51,15 @@ class ChatResponseSchema(BaseModel):
     end: int
 
 
+class ChatMessageCursorSchema(BaseModel):
+    before: datetime
+    before_id: HexUUID
+
+
 class ChatMessageResponseSchema(BaseModel):
     messages: list[ChatMessageSchema]
     end: int
+    cursor: Optional[ChatMessageCursorSchema] = None
 
     class Config:
         from_attributes = True
-        json_encoders = {UUID: lambda v: v.hex, datetime: lambda v: int(v.timestamp())}
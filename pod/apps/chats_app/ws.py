@@ -1,4 +1,5 @@
-import asyncio
+from types import MappingProxyType
+from typing import Awaitable, Callable, Mapping
 
 from fastapi import APIRouter, WebSocket
 from redis.asyncio.client import PubSub
@@ -17,20 +18,9 @@ async def enter_home(websocket_dependency: websocketDependency):
     user_id: str = websocket_dependency.user_id.hex
     websocket: WebSocket = websocket_dependency.websocket
 
-    message_handlers = {
-        ChatEvent.goes_online: handle_goes_online,
-        ChatEvent.goes_offline: handle_goes_offline,
-        ChatEvent.typing_start: handle_typing_start,
-        ChatEvent.typing_stop: handle_typing_stop,
-        ChatEvent.enter_chat: handle_enter_chat,
-        ChatEvent.exit_chat: handle_exit_chat,
-        ChatEvent.sent_message: handle_sent_message,
-        ChatEvent.created_chat: handle_created_chat,
-    }
-
     async with WebSocketContextManager(websocket=websocket, user_id=user_id, connect_handler=chat_connect, disconnect_handler=chat_disconnect,
                                        pubsub_generator=chat_pubsub_generator,
-                                       message_handlers=message_handlers) as connection:
+                                       message_handlers=_HOME_MESSAGE_HANDLERS) as connection:
         await connection.wait_until_disconnected()
 
 
@@ -39,8 +29,7 @@ async def chat_connect(user_id: str, websocket: WebSocket):
     await chat_ws_manager.connect(user_id=user_id, websocket=websocket)
     participant_ids: set[str] = await chat_cache_manager.add_user_to_chats(user_id=user_id)
     data = {"type": ChatEvent.goes_online.value, "participant_id": user_id}
-    tasks = [pubsub_manager.publish(topic=f"chats:home:{pid}", data=data) for pid in participant_ids]
-    await asyncio.gather(*tasks)
+    await pubsub_manager.publish_many(topics=[f"chats:home:{pid}" for pid in participant_ids], data=data)
 
 
 async def chat_disconnect(user_id: str, websocket: WebSocket):
@@ -49,8 +38,7 @@ async def chat_disconnect(user_id: str, websocket: WebSocket):
     # Notify participants
     participant_ids: set[str] = await chat_cache_manager.remove_user_from_chats(user_id)
     data = {"type": ChatEvent.goes_offline.value, "participant_id": user_id}
-    tasks = [pubsub_manager.publish(topic=f"chats:home:{pid}", data=data) for pid in participant_ids]
-    await asyncio.gather(*tasks)
+    await pubsub_manager.publish_many(topics=[f"chats:home:{pid}" for pid in participant_ids], data=data)
 
 
 async def chat_pubsub_generator(user_id: str) -> PubSub:
@@ -65,52 +53,50 @@ async def handle_outgoing_event(chat_event: ChatEvent, user_id: str, data: dict)
             await chat_cache_manager.add_typing(user_id, chat_id)
             participant_ids: set[str] = await chat_cache_manager.get_chat_participants(chat_id=chat_id)
             participant_ids.discard(user_id)
-            for pid in participant_ids:
-                await pubsub_manager.publish(f"chats:home:{pid}", data)
-        case ChatEvent.typing_start:
+            await pubsub_manager.publish_many(topics=[f"chats:home:{pid}" for pid in participant_ids], data=data)
+        case ChatEvent.typing_stop:
             chat_id = data.get("chat_id")
-            await chat_cache_manager.add_typing(user_id, chat_id)
+            await chat_cache_manager.remove_typing(user_id, chat_id)
             participant_ids: set[str] = await chat_cache_manager.get_chat_participants(chat_id=chat_id)
             participant_ids.discard(user_id)
-            for pid in participant_ids:
-                await pubsub_manager.publish(f"chats:home:{pid}", data)
+            await pubsub_manager.publish_many(topics=[f"chats:home:{pid}" for pid in participant_ids], data=data)
         case ChatEvent.sent_message:
             chat_id = data.get("chat_id")
             # TODO Save to DB here
             participant_ids: set[str] = await chat_cache_manager.get_chat_participants(chat_id=chat_id)
+            await chat_cache_manager.invalidate_cached_chats(user_ids=participant_ids)
             participant_ids.discard(user_id)
-            for pid in participant_ids:
-                await pubsub_manager.publish(f"chats:home:{pid}", data)
+            await pubsub_manager.publish_many(topics=[f"chats:home:{pid}" for pid in participant_ids], data=data)
 
 
 # Event handlers
 async def handle_goes_online(user_id: str, data: dict[str, str]):
-    my_logger.debug(f"User {data.get('participant_id')} came online")
+    my_logger.debug("User {} came online", data.get('participant_id'))
     await chat_ws_manager.send_personal_message(user_id=user_id, data=data)
 
 
 async def handle_goes_offline(user_id: str, data: dict):
-    my_logger.debug(f"User {data.get('participant_id')} went offline")
+    my_logger.debug("User {} went offline", data.get('participant_id'))
     await chat_ws_manager.send_personal_message(user_id=user_id, data=data)
 
 
 async def handle_typing_start(user_id: str, data: dict):
-    my_logger.debug(f"User started typing in {data.get('chat_id')}")
+    my_logger.debug("User started typing in {}", data.get('chat_id'))
     await chat_ws_manager.send_personal_message(user_id=user_id, data=data)
 
 
 async def handle_typing_stop(user_id: str, data: dict):
-    my_logger.debug(f"User stopped typing in {data.get('chat_id')}")
+    my_logger.debug("User stopped typing in {}", data.get('chat_id'))
     await chat_ws_manager.send_personal_message(user_id=user_id, data=data)
 
 
 async def handle_enter_chat(user_id: str, data: dict):
-    my_logger.debug(f"User entered to {data.get('chat_id')} room")
+    my_logger.debug("User entered to {} room", data.get('chat_id'))
     await chat_ws_manager.send_personal_message(user_id=user_id, data=data)
 
 
 async def handle_exit_chat(user_id: str, data: dict):
-    my_logger.debug(f"User exited from {data.get('chat_id')} room")
+    my_logger.debug("User exited from {} room", data.get('chat_id'))
     await chat_ws_manager.send_personal_message(user_id=user_id, data=data)
 
 
@@ -122,5 +108,18 @@ async def handle_sent_message(user_id: str, data: dict):
 async def handle_created_chat(user_id: str, data: dict):
     participant_id = data.get("participant", {}).get("id")
     chat_id = data.get("id")
-    my_logger.debug(f"User {participant_id} created a chat room (ID: {chat_id}) with you ({user_id})")
+    my_logger.debug("User {} created a chat room (ID: {}) with you ({})", participant_id, chat_id, user_id)
     await chat_ws_manager.send_personal_message(user_id=user_id, data=data)
+
+
+# Built once at import; read-only so a handler cannot mutate the table shared by every connection
+_HOME_MESSAGE_HANDLERS: Mapping[ChatEvent, Callable[[str, dict], Awaitable[None]]] = MappingProxyType({
+    ChatEvent.goes_online: handle_goes_online,
+    ChatEvent.goes_offline: handle_goes_offline,
+    ChatEvent.typing_start: handle_typing_start,
+    ChatEvent.typing_stop: handle_typing_stop,
+    ChatEvent.enter_chat: handle_enter_chat,
+    ChatEvent.exit_chat: handle_exit_chat,
+    ChatEvent.sent_message: handle_sent_message,
+    ChatEvent.created_chat: handle_created_chat,
+})
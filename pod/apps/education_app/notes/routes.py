@@ -3,12 +3,14 @@ import os
 import aiofiles
 from fastapi import APIRouter, Header, UploadFile, status
 
+from utility.my_logger import my_logger
+
 education_router = APIRouter()
 
 
 @education_router.post(path="/vocabulary/images", status_code=status.HTTP_200_OK)
 async def upload_images(files: list[UploadFile], content_type: str = Header()):
-    print(f"📝 content_type when post: {content_type}")
+    my_logger.debug("content_type when post: {}", content_type)
 
     cwd: str = os.getcwd()
     os.makedirs(os.path.join(cwd, "flutter_images"), exist_ok=True)
@@ -22,7 +24,7 @@ async def upload_images(files: list[UploadFile], content_type: str = Header()):
                     while chunk := await file.read(1024 * 1024):
                         await f.write(chunk)
     except Exception as e:
-        print(f"🌋 Exception while writing file: {e}")
+        my_logger.exception("Exception while writing file: {}", e)
 
 
 @education_router.get(path="/vocabulary/images/get", status_code=status.HTTP_200_OK)
@@ -34,12 +36,12 @@ async def get_images():
         extracted_words = []
 
         file_paths = os.listdir(temp_file_path)
-        print(f"📝 file_paths: {file_paths}")
+        my_logger.debug("file_paths: {}", file_paths)
 
         for file_path in file_paths:
-            print(f"📝 absolute path: {temp_file_path}/{file_path}")
+            my_logger.debug("absolute path: {}/{}", temp_file_path, file_path)
             extracted_text: str = ""  # await image_to_string(f"{temp_file_path}/{file_path}", lang="eng+uzb")
-            print(f"extracted_text: {extracted_text}")
+            my_logger.debug("extracted_text: {}", extracted_text)
             for text in extracted_text:
                 lines = text.split("\n")
                 word = lines[0].strip()
@@ -47,11 +49,11 @@ async def get_images():
                 if word:
                     extracted_words.append(word)
 
-        print(f"📝 extracted_words: {extracted_words}")
+        my_logger.debug("extracted_words: {}", extracted_words)
         # shutil.rmtree(temp_file_path)
 
         return extracted_words
 
     except Exception as e:
-        print(f"🌋 Exception while reading file: {e}")
+        my_logger.exception("Exception while reading file: {}", e)
         return "fuck off!"
@@ -1,11 +1,11 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import TIMESTAMP, UUID, Enum, ForeignKey, String, UniqueConstraint
+from sqlalchemy import TIMESTAMP, UUID, Boolean, Enum, ForeignKey, Index, String, UniqueConstraint, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from apps.users_app.models import BaseModel, UserModel
-from utility.my_enums import EngagementType, FeedVisibility, ReportReason, CommentPolicy
+from utility.my_enums import FeedVisibility, ReportReason, CommentPolicy
 
 
 class CategoryModel(BaseModel):
@@ -20,7 +20,7 @@ class CategoryModel(BaseModel):
 class TagModel(BaseModel):
     __tablename__ = "tag_table"
     name: Mapped[str] = mapped_column(String(length=50), nullable=False, unique=True)
-    feed_links: Mapped[list["FeedTagLink"]] = relationship(back_populates="tag", cascade="all, delete-orphan")
+    feed_links: Mapped[list["FeedTagLink"]] = relationship(back_populates="tag", cascade="all, delete-orphan", passive_deletes=True)
     feeds: Mapped[list["FeedModel"]] = relationship(secondary="feed_tag_link_table", back_populates="tags", overlaps="feed_links, tag")
 
     def __repr__(self):
@@ -37,6 +37,7 @@ class FeedTagLink(BaseModel):
 
 class FeedModel(BaseModel):
     __tablename__ = "feed_table"
+    __table_args__ = (Index("ix_feed_author_created", "author_id", "created_at"), Index("ix_feed_parent_created", "parent_id", "created_at"))
     body: Mapped[str] = mapped_column(String(200))
     author_id: Mapped[UUID] = mapped_column(ForeignKey("user_table.id", ondelete="CASCADE"), nullable=False)
     author: Mapped["UserModel"] = relationship(argument="UserModel", back_populates="feeds")
@@ -54,9 +55,9 @@ class FeedModel(BaseModel):
     comments: Mapped[list["FeedModel"]] = relationship(back_populates="parent", foreign_keys=[parent_id], cascade="all, delete-orphan", passive_deletes=True)
     category_id: Mapped[Optional[UUID]] = mapped_column(ForeignKey("category_table.id", ondelete="CASCADE"))
     category: Mapped[Optional["CategoryModel"]] = relationship(argument="CategoryModel", back_populates="feeds")
-    tag_links: Mapped[list["FeedTagLink"]] = relationship(back_populates="feed", overlaps="feeds, tags", cascade="all, delete-orphan")
+    tag_links: Mapped[list["FeedTagLink"]] = relationship(back_populates="feed", overlaps="feeds, tags", cascade="all, delete-orphan", passive_deletes=True)
     tags: Mapped[list["TagModel"]] = relationship(secondary="feed_tag_link_table", back_populates="feeds", overlaps="feed_links,feed,tag")
-    engagements: Mapped[list["EngagementModel"]] = relationship(argument="EngagementModel", back_populates="feed", cascade="all, delete-orphan")
+    engagements: Mapped[list["EngagementModel"]] = relationship(argument="EngagementModel", back_populates="feed", cascade="all, delete-orphan", passive_deletes=True)
     reports: Mapped[list["ReportModel"]] = relationship(argument="ReportModel", back_populates="feed", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
@@ -65,10 +66,14 @@ class FeedModel(BaseModel):
 
 class EngagementModel(BaseModel):
     __tablename__ = "engagement_table"
-    __table_args__ = (UniqueConstraint("user_id", "feed_id", "engagement_type", name="uq_feed_engagement"),)
+    # One row per (user, feed) with a flag per engagement kind instead of one row per kind
+    __table_args__ = (UniqueConstraint("user_id", "feed_id", name="uq_feed_engagement"), Index("ix_engagement_feed", "feed_id"))
     user_id: Mapped[UUID] = mapped_column(ForeignKey("user_table.id", ondelete="CASCADE"), nullable=False)
     feed_id: Mapped[UUID] = mapped_column(ForeignKey("feed_table.id", ondelete="CASCADE"), nullable=False)
-    engagement_type: Mapped[EngagementType] = mapped_column(Enum(EngagementType, name="engagement_type"), nullable=False)
+    reposted: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false(), nullable=False)
+    liked: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false(), nullable=False)
+    bookmarked: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false(), nullable=False)
+    viewed_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
     user: Mapped["UserModel"] = relationship(argument="UserModel", back_populates="engagements", passive_deletes=True)
     feed: Mapped["FeedModel"] = relationship(argument="FeedModel", back_populates="engagements", passive_deletes=True)
 
@@ -81,6 +86,7 @@ class ReportModel(BaseModel):
     __table_args__ = (UniqueConstraint("user_id", "feed_id", "report_reason", name="uq_feed_report"),)
     user_id: Mapped[UUID] = mapped_column(ForeignKey("user_table.id", ondelete="CASCADE"), nullable=False)
     feed_id: Mapped[UUID] = mapped_column(ForeignKey("feed_table.id", ondelete="CASCADE"), nullable=False)
-    report_reason: Mapped[ReportReason] = mapped_column(Enum(ReportReason, name="report_reason"), nullable=False)
+    # VARCHAR + CHECK instead of a PG enum type: new reasons need no ALTER TYPE and no pg_type lookup
+    report_reason: Mapped[ReportReason] = mapped_column(Enum(ReportReason, name="report_reason", native_enum=False, length=32, create_constraint=True), nullable=False)
     user: Mapped["UserModel"] = relationship(argument="UserModel", back_populates="reports", passive_deletes=True)
     feed: Mapped["FeedModel"] = relationship(argument="FeedModel", back_populates="reports")
@@ -1,31 +1,65 @@
 import asyncio
 from datetime import datetime, timedelta, UTC
-from typing import Annotated, Optional
-from uuid import UUID
+from enum import Enum
+from typing import Annotated, Any, Optional
+from uuid import UUID, uuid4
 
-import aiofiles
 from fastapi import APIRouter, Form, HTTPException, UploadFile, File
-from ffmpeg.asyncio import FFmpeg
-from sqlalchemy import Result, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import literal, select, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
 
-from apps.feeds_app.models import EngagementType, FeedModel, TagModel, CategoryModel
+from apps.feeds_app.models import FeedModel, FeedTagLink, TagModel, CategoryModel
 from apps.feeds_app.schemas import FeedSchema, FeedResponseSchema, EngagementSchema
-from apps.feeds_app.tasks import notify_followers_task, set_engagement_task, remove_engagement_task
+from apps.feeds_app.tasks import faststart_video_task, notify_followers_task, set_engagement_task, remove_engagement_task
+from apps.users_app.models import UserModel
 from settings.my_config import get_settings
 from settings.my_database import DBSession
 from settings.my_dependency import strictJwtDependency, jwtDependency
 from settings.my_exceptions import NotFoundException, ValidationException
 from settings.my_minio import put_file_to_minio, put_object_to_minio, remove_objects_from_minio
 from settings.my_redis import cache_manager
-from utility.my_enums import CommentPolicy, FeedVisibility
+from utility.my_enums import CommentPolicy, EngagementType, FeedVisibility
 from utility.my_logger import my_logger
-from utility.validators import allowed_image_extension, allowed_video_extension, get_file_extension, get_video_duration_using_ffprobe
+from utility.orjson_response import ORJSONResponse
+from utility.validators import allowed_image_extension, allowed_video_extension, get_file_extension, get_video_duration_using_ffprobe, is_faststart_mp4
 
 feed_router = APIRouter()
 
 settings = get_settings()
 
+DISCOVER_TIMELINE_ERROR = "Something went wrong while getting discover timeline"
+FOLLOWING_TIMELINE_ERROR = "Something went wrong while getting following timeline"
+
+MAX_FEED_IMAGE_SIZE = 4 * 1024 * 1024
+MAX_FEED_VIDEO_SIZE = 500 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+VIDEO_CHUNK_SIZE = 16 * 1024 * 1024
+MAX_SCHEDULE_AHEAD = timedelta(days=7)
+
+# Built once at import; handlers only add where/offset/limit, so the loader options are not rebuilt per request
+# One SELECT reloads a feed after commit: to-one author and category ride along as joins, tags come in a single IN query
+_FEED_STMT = select(FeedModel).options(
+    joinedload(FeedModel.author).load_only(UserModel.id, UserModel.name, UserModel.username, UserModel.avatar_url),
+    joinedload(FeedModel.category),
+    selectinload(FeedModel.tags),
+    raiseload("*"),
+)
+_FEED_UPDATE_LOAD_ONLY = load_only(
+    FeedModel.body, FeedModel.scheduled_at, FeedModel.feed_visibility, FeedModel.comment_policy, FeedModel.image_url, FeedModel.video_url
+)
+_COMMENTS_STMT = (
+    select(FeedModel)
+    .order_by(FeedModel.created_at.asc())
+    .options(
+        selectinload(FeedModel.author).load_only(UserModel.id, UserModel.name, UserModel.username, UserModel.avatar_url),
+        selectinload(FeedModel.tags),
+        selectinload(FeedModel.category),
+        raiseload("*"),
+    )
+)
+
 
 @feed_router.post(path="/create", response_model=FeedSchema, response_model_exclude_defaults=True, response_model_exclude_none=True, status_code=201)
 async def create_feed_route(jwt: strictJwtDependency, session: DBSession,
@@ -47,10 +81,9 @@ async def create_feed_route(jwt: strictJwtDependency, session: DBSession,
 
         if scheduled_at is not None:
             now = datetime.now(UTC)
-            max_future = now + timedelta(days=7)
             if scheduled_at < now:
                 raise ValidationException("Scheduled time cannot be in the past.")
-            if scheduled_at > max_future:
+            if scheduled_at - now > MAX_SCHEDULE_AHEAD:
                 raise ValidationException("Scheduled time cannot be more than 7 days in the future.")
 
         feed = FeedModel(author_id=jwt.user_id, body=body, scheduled_at=scheduled_at, quote_id=quote_id, parent_id=parent_id)
@@ -60,50 +93,49 @@ async def create_feed_route(jwt: strictJwtDependency, session: DBSession,
         if feed_visibility is not None and feed_visibility != FeedVisibility.public:
             feed.feed_visibility = feed_visibility
 
-        if category_id:
-            category_exists: Optional[CategoryModel] = await session.scalar(select(CategoryModel).where(CategoryModel.id == category_id))
-            if not category_exists:
-                raise HTTPException(status_code=400, detail="Invalid category ID.")
-            feed.category_id = category_exists.id
+        if category_id or tags:
+            category_found, found_tag_ids = await _existing_category_and_tags(session=session, category_id=category_id, tag_ids=tags)
 
-        if tags:
-            tag_ids_in_db = await session.scalars(select(TagModel.id).where(TagModel.id.in_(tags)))
-            found_tag_ids = set(tag_ids_in_db.all())
-            missing_tags = set(tags) - found_tag_ids
-            if missing_tags:
-                raise NotFoundException(detail=f"Tag(s) not found: {', '.join(str(tag) for tag in missing_tags)}")
+            if category_id:
+                if not category_found:
+                    raise HTTPException(status_code=400, detail="Invalid category ID.")
+                feed.category_id = category_id
 
-            tags = await session.scalars(select(TagModel).where(TagModel.id.in_(tags)))
-            feed.tags.extend(tags.all())
+            if tags:
+                missing_tags = set(tags) - found_tag_ids
+                if missing_tags:
+                    raise NotFoundException(detail=f"Tag(s) not found: {', '.join(str(tag) for tag in missing_tags)}")
+                # Link rows by id; the tag rows themselves are loaded by the refresh after commit
+                feed.tag_links.extend(FeedTagLink(tag_id=tag_id) for tag_id in found_tag_ids)
 
-        if image_file:
-            my_logger.debug(f"image_file: {image_file}")
-            image_url = await validate_and_save_image(user_id=jwt.user_id.hex, image_file=image_file)
-            my_logger.debug(f"image_url: {image_url}")
-            feed.image_url = image_url
+            # End the read-only transaction so no pooled connection is pinned while media is validated and uploaded
+            await session.commit()
 
-        if video_file:
-            my_logger.debug(f"video_file.filename: {video_file.filename}")
-            video_url = await validate_and_save_video(user_id=jwt.user_id.hex, video_file=video_file)
-            my_logger.debug(f"video_url: {video_url}")
-            feed.video_url = video_url
+        media, needs_faststart = await _save_feed_media(user_id=jwt.user_id.hex, image_file=image_file, video_file=video_file)
+        for field, url in media.items():
+            my_logger.debug("{}: {}", field, url)
+            setattr(feed, field, url)
 
         session.add(instance=feed)
-        await session.commit()
-        await session.refresh(instance=feed, attribute_names=["id", "created_at", "updated_at", "author", "tags", "category"])
+        await _commit_feed(session=session)
+        if needs_faststart:
+            await faststart_video_task.kiq(object_name=media["video_url"], content_type=video_file.content_type)
+        feed = (await session.scalars(_FEED_STMT.where(FeedModel.id == feed.id).execution_options(populate_existing=True))).one()
 
-        feed_schema = FeedSchema.model_validate(obj=feed)
-        mapping = feed_schema.model_dump(exclude_unset=True, exclude_defaults=True, exclude_none=True, mode="json")
-        my_logger.debug(f"mapping: {mapping}")
+        # Dumped once: the same JSON-ready dict fills the Redis hash and the response body, so response_model does not validate and dump it again
+        content = FeedSchema.model_validate(obj=feed).model_dump(exclude_unset=True, exclude_defaults=True, exclude_none=True, mode="json")
 
-        await cache_manager.create_feed(mapping=mapping)
+        # create_feed pops "author" and adds "author_id" on the mapping it is given
+        await cache_manager.create_feed(mapping={**content})
 
         my_logger.warning("notification is starting...")
         if feed.feed_visibility in [FeedVisibility.public, FeedVisibility.followers] and parent_id is None:
             my_logger.warning("notification is processing...")
             await notify_followers_task.kiq(user_id=jwt.user_id.hex)
 
-        return feed_schema
+        return ORJSONResponse(content=content, status_code=201)
+    except HTTPException:
+        raise
     except Exception as e:
         my_logger.exception(f"Exception while creating feed, e: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -123,17 +155,18 @@ async def update_feed_route(jwt: strictJwtDependency, session: DBSession,
                             remove_video: Annotated[Optional[str], Form()] = None,
                             remove_image: Annotated[Optional[str], Form()] = None):
     try:
-        my_logger.debug(f"body: {body}")
-        my_logger.debug(f"video_file.filename: {video_file.filename if video_file is not None else None}")
-        my_logger.debug(f"image_file.filename: {image_file.filename if video_file is not None else None}")
-        my_logger.debug(f"remove_video: {remove_video}")
-        my_logger.debug(f"remove_image: {remove_image}")
-
-        stmt = select(FeedModel).where(FeedModel.id == feed_id)
-        result: Result = await session.execute(stmt)
-        feed: Optional[FeedModel] = result.scalar_one_or_none()
+        my_logger.debug("body: {}", body)
+        my_logger.debug("video_file.filename: {}", video_file.filename if video_file is not None else None)
+        my_logger.debug("image_file.filename: {}", image_file.filename if video_file is not None else None)
+        my_logger.debug("remove_video: {}", remove_video)
+        my_logger.debug("remove_image: {}", remove_image)
+
+        # Only the columns this handler compares against; the full row is reloaded by _FEED_STMT after commit
+        feed: Optional[FeedModel] = await session.get(FeedModel, feed_id, options=[_FEED_UPDATE_LOAD_ONLY, selectinload(FeedModel.tags), raiseload("*")])
         if feed is None:
             raise NotFoundException(detail="feed not found")
+        # Release the connection now; ffprobe/ffmpeg/MinIO below must not hold a pool slot, and the next query checks one out again
+        await session.commit()
 
         if body is not None:
             if not body.strip():
@@ -141,69 +174,75 @@ async def update_feed_route(jwt: strictJwtDependency, session: DBSession,
             if len(body) > 300:
                 raise ValidationException(detail="body is exceeded max 300 character limit.")
 
-            if feed.body != body:
-                feed.body = body
-                await cache_manager.update_feed(feed_id=feed_id.hex, key="body", value=body)
+        # Changed fields are collected and written to the cached feed hash in one round-trip once the DB commit succeeds
+        changes = _changed_fields(feed=feed, body=body, feed_visibility=feed_visibility, comment_policy=comment_policy)
+        cache_changes: dict[str, Any] = {key: value.value if isinstance(value, Enum) else value for key, value in changes.items()}
 
         now = datetime.now(UTC)
         if scheduled_at is not None and feed.scheduled_at > now:
-            max_future = now + timedelta(days=7)
             if scheduled_at < now:
                 raise ValidationException("Scheduled time cannot be in the past.")
-            if scheduled_at > max_future:
+            if scheduled_at - now > MAX_SCHEDULE_AHEAD:
                 raise ValidationException("Scheduled time cannot be more than 7 days in the future.")
 
-        if feed_visibility is not None and feed.feed_visibility != feed_visibility:
-            feed.feed_visibility = feed_visibility
-            await cache_manager.update_feed(feed_id=feed.id.hex, key="feed_visibility", value=feed_visibility.value)
-
-        if comment_policy is not None and feed.comment_policy != comment_policy:
-            feed.comment_policy = comment_policy
-            await cache_manager.update_feed(feed_id=feed.id.hex, key="comment_policy", value=comment_policy.value)
-
+        # Every id is validated before any MinIO side effect, so a bad category or tag leaves stored media untouched
+        tag_rows: list[TagModel] = []
         if category_id:
-            category_exists: Optional[CategoryModel] = await session.scalar(select(CategoryModel).where(CategoryModel.id == category_id))
-            if not category_exists:
+            category_found, _ = await _existing_category_and_tags(session=session, category_id=category_id, tag_ids=None)
+            if not category_found:
                 raise HTTPException(status_code=400, detail="Invalid category ID.")
-            feed.category_id = category_exists.id
-            await cache_manager.update_feed(feed_id=feed.id.hex, key="category_id", value=category_id)
 
         if tags:
-            tag_ids_in_db = await session.scalars(select(TagModel.id).where(TagModel.id.in_(tags)))
-            found_tag_ids = set(tag_ids_in_db.all())
-            missing_tags = set(tags) - found_tag_ids
+            tag_rows = list((await session.scalars(select(TagModel).where(TagModel.id.in_(tags)))).all())
+            missing_tags = set(tags) - {tag.id for tag in tag_rows}
             if missing_tags:
                 raise NotFoundException(detail=f"Tag(s) not found: {', '.join(str(tag) for tag in missing_tags)}")
 
-            db_tags = await session.scalars(select(TagModel).where(TagModel.id.in_(tags)))
-            feed.tags.extend(db_tags.all())
-            await cache_manager.update_feed(feed_id=feed.id.hex, key="tags", value=tags)
+        if category_id or tags:
+            # Nothing is modified yet, so this only hands the connection back before the uploads below
+            await session.commit()
 
+        # Old objects are only collected here; they are removed once the new state is committed
+        removed_objects = []
         if remove_image and feed.image_url:
-            await remove_objects_from_minio([feed.image_url])
+            removed_objects.append(feed.image_url)
         if remove_video and feed.video_url == remove_video:
-            await remove_objects_from_minio([feed.video_url])
-
-        if image_file:
-            my_logger.debug(f"image_file: {image_file}")
-            url = await validate_and_save_image(user_id=jwt.user_id.hex, image_file=image_file)
-            my_logger.debug(f"url: {url}")
-            feed.image_url = url
-            await cache_manager.update_feed(feed_id=feed.id.hex, key="image_url", value=url)
-
-        if video_file:
-            my_logger.debug(f"video_file.filename: {video_file.filename}")
-            object_name = await validate_and_save_video(user_id=jwt.user_id.hex, video_file=video_file)
-            my_logger.debug(f"object_name: {object_name}")
-            feed.video_url = object_name
-            await cache_manager.update_feed(feed_id=feed.id.hex, key="video_url", value=object_name)
+            removed_objects.append(feed.video_url)
+
+        media, needs_faststart = await _save_feed_media(user_id=jwt.user_id.hex, image_file=image_file, video_file=video_file)
+        my_logger.debug("media: {}", media)
+        changes.update(media)
+        cache_changes.update(media)
+
+        for key, value in changes.items():
+            setattr(feed, key, value)
+
+        if category_id:
+            feed.category_id = category_id
+
+        if tags:
+            feed.tags.extend(tag for tag in tag_rows if tag not in feed.tags)
 
         session.add(instance=feed)
-        await session.commit()
-        await session.refresh(instance=feed, attribute_names=["id", "created_at", "updated_at", "author", "tags", "category"])
+        await _commit_feed(session=session)
+        if needs_faststart:
+            await faststart_video_task.kiq(object_name=media["video_url"], content_type=video_file.content_type)
+        if removed_objects:
+            await remove_objects_from_minio(removed_objects)
+        feed = (await session.scalars(_FEED_STMT.where(FeedModel.id == feed.id).execution_options(populate_existing=True))).one()
+
+        # Category and tags are cached in FeedSchema's shape, so they are taken from the reloaded row
+        if category_id:
+            cache_changes["category"] = {"name": feed.category.name}
+        if tags:
+            cache_changes["tags"] = [{"name": tag.name} for tag in feed.tags]
+        if cache_changes:
+            await cache_manager.update_feed(feed_id=feed_id.hex, mapping=cache_changes)
 
         feed_schema = FeedSchema.model_validate(obj=feed)
         return feed_schema
+    except HTTPException:
+        raise
     except Exception as e:
         my_logger.exception(f"Exception while creating post media, e: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -211,70 +250,65 @@ async def update_feed_route(jwt: strictJwtDependency, session: DBSession,
 
 @feed_router.delete(path="/delete", status_code=204)
 async def delete_feed_route(jwt: strictJwtDependency, feed_id: UUID, session: DBSession):
-    feed: Optional[FeedModel] = await session.get(FeedModel, feed_id)
+    # The tags secondary rows are deleted by the unit of work, which needs the collection; load it up front instead of lazily under async
+    feed: Optional[FeedModel] = await session.get(FeedModel, feed_id, options=[selectinload(FeedModel.tags)])
     if feed is None:
         raise NotFoundException(detail="feed not found")
 
-    if feed.video_url:
-        await remove_objects_from_minio(object_names=[feed.video_url])
-    if feed.image_url:
-        await remove_objects_from_minio(object_names=[feed.image_url])
+    media_objects = [url for url in (feed.video_url, feed.image_url) if url]
+    if media_objects:
+        await remove_objects_from_minio(object_names=media_objects)
     await session.delete(instance=feed)
     await session.commit()
     await cache_manager.delete_feed(author_id=jwt.user_id.hex, feed_id=feed_id.hex)
 
 
-@feed_router.get(path="/timeline/discover", response_model=FeedResponseSchema, response_model_exclude_none=True, response_model_exclude_defaults=True, status_code=200)
+# Timelines are shaped into FeedSchema's JSON form by CacheManager._get_feeds (nulls and defaults already left out), so they go
+# straight out as ORJSONResponse; response_model only documents that shape and is not re-applied to a returned Response
+@feed_router.get(path="/timeline/discover", response_model=FeedResponseSchema, status_code=200)
 async def discover_timeline_route(jwt: jwtDependency, start: int = 0, end: int = 9):
     try:
         feeds = await cache_manager.get_discover_timeline(user_id=jwt.user_id.hex if jwt is not None else None, start=start, end=end)
-        return feeds
+        return ORJSONResponse(content=feeds)
     except Exception as e:
-        print(f"Exception in discover_timeline_route: {e}")
-        raise HTTPException(status_code=400, detail=f"Exception in discover_timeline_route: {e}")
+        my_logger.exception("Exception in discover_timeline_route: {}", e)
+        raise HTTPException(status_code=400, detail=DISCOVER_TIMELINE_ERROR) from e
 
 
-@feed_router.get(path="/timeline/following", response_model=FeedResponseSchema, response_model_exclude_none=True, response_model_exclude_defaults=True, status_code=200)
+@feed_router.get(path="/timeline/following", response_model=FeedResponseSchema, status_code=200)
 async def following_timeline_route(jwt: strictJwtDependency, start: int = 0, end: int = 9):
     try:
         feeds = await cache_manager.get_following_timeline(user_id=jwt.user_id.hex, start=start, end=end)
-        return feeds
+        return ORJSONResponse(content=feeds)
     except Exception as e:
         my_logger.critical(f"Exception in following_timeline_route: {e}")
-        raise HTTPException(status_code=400, detail=f"Exception in following_timeline_route: {e}")
+        raise HTTPException(status_code=400, detail=FOLLOWING_TIMELINE_ERROR) from e
 
 
-@feed_router.get(path="/timeline/user", response_model=FeedResponseSchema, response_model_exclude_none=True, response_model_exclude_defaults=True, status_code=200)
+@feed_router.get(path="/timeline/user", response_model=FeedResponseSchema, status_code=200)
 async def user_timeline_route(jwt: strictJwtDependency, engagement_type: EngagementType, start: int = 0, end: int = 9):
     try:
         feeds = await cache_manager.get_user_timeline(user_id=jwt.user_id.hex, engagement_type=engagement_type, start=start, end=end)
-        return feeds
+        return ORJSONResponse(content=feeds)
     except Exception as e:
-        my_logger.debug(f"Exception in user_timeline route: {e}")
+        my_logger.debug("Exception in user_timeline route: {}", e)
         raise HTTPException(status_code=500, detail="Server error occurred while creating feed.")
 
 
 @feed_router.get(path="/comments", response_model=FeedResponseSchema, response_model_exclude_none=True, response_model_exclude_defaults=True, status_code=200)
 async def get_comments(jwt: strictJwtDependency, feed_id: UUID, session: DBSession, start: int = 0, end: int = 9):
     try:
-        stmt = (
-            select(FeedModel)
-            .where(FeedModel.parent_id == feed_id)
-            .order_by(FeedModel.created_at.asc())
-            .offset(start)
-            .limit(end - start + 1)
-            .options(selectinload(FeedModel.author), selectinload(FeedModel.tags), selectinload(FeedModel.category))
-        )
+        stmt = _COMMENTS_STMT.where(FeedModel.parent_id == feed_id).offset(start).limit(end - start + 1)
         results = await session.scalars(stmt)
         comments: list[FeedModel] = results.all()
 
         if comments:
-            my_logger.debug(f"comments: {comments}, comments[0].__dict__: {comments[0].__dict__}")
-            my_logger.debug(f"comments: {comments}, comments[0].author.username: {comments[0].author.username}")
+            my_logger.debug("comments: {}, comments[0].__dict__: {}", comments, comments[0].__dict__)
+            my_logger.debug("comments: {}, comments[0].author.username: {}", comments, comments[0].author.username)
 
         end: int = await cache_manager.get_comments_count(feed_id=feed_id.hex)
-        my_logger.debug(f"end: {end}")
-        engagements: list[dict] = await asyncio.gather(*[cache_manager.get_engagement(user_id=jwt.user_id.hex, feed_id=comment.id.hex, is_comment=True) for comment in comments])
+        my_logger.debug("end: {}", end)
+        engagements: list[dict] = await cache_manager.get_engagements(user_id=jwt.user_id.hex, feed_ids=[comment.id.hex for comment in comments], is_comment=True)
         schemas: list[FeedSchema] = [FeedSchema.model_validate({**comment.__dict__, "engagement": engagement}) for comment, engagement in zip(comments, engagements)]
 
         return {"feeds": schemas, "end": end}
@@ -287,7 +321,7 @@ async def get_comments(jwt: strictJwtDependency, feed_id: UUID, session: DBSessi
 async def set_engagement(jwt: strictJwtDependency, feed_id: UUID, engagement_type: EngagementType, is_comment: bool = False):
     engagement = await cache_manager.set_engagement(user_id=jwt.user_id.hex, feed_id=feed_id.hex, engagement_type=engagement_type, is_comment=is_comment)
     await set_engagement_task.kiq(user_id=jwt.user_id.hex, feed_id=feed_id, engagement_type=engagement_type)
-    my_logger.debug(f"engagement: {engagement}")
+    my_logger.debug("engagement: {}", engagement)
 
     if engagement_type == EngagementType.reposts:
         follower_ids = cache_manager.get_followers(user_id=jwt.user_id.hex)
@@ -303,7 +337,7 @@ async def set_engagement(jwt: strictJwtDependency, feed_id: UUID, engagement_typ
 async def remove_engagement(jwt: strictJwtDependency, feed_id: UUID, engagement_type: EngagementType, is_comment: bool = False):
     engagement = await cache_manager.remove_engagement(user_id=jwt.user_id.hex, feed_id=feed_id.hex, engagement_type=engagement_type, is_comment=is_comment)
     await remove_engagement_task.kiq(user_id=jwt.user_id.hex, feed_id=feed_id, engagement_type=engagement_type)
-    my_logger.debug(f"engagement: {engagement}")
+    my_logger.debug("engagement: {}", engagement)
     return engagement
 
 
@@ -316,59 +350,151 @@ async def feed_search(jwt: jwtDependency, query: str, offset: int = 0, limit: in
         raise HTTPException(status_code=500, detail="🤯 WTF? Something just exploded on our end. Try again later!")
 
 
+async def _existing_category_and_tags(session: AsyncSession, category_id: Optional[UUID], tag_ids: Optional[list[UUID]]) -> tuple[bool, set[UUID]]:
+    """Check category and tag ids against the cached id sets, then in one DB round-trip for any miss; returns whether the category exists and which tag ids exist."""
+    tag_ids = tag_ids or []
+    cached_category, cached_tag_hexes = await cache_manager.get_known_category_and_tags(category_id=category_id.hex if category_id else None, tag_ids=[tag_id.hex for tag_id in tag_ids])
+    found_tag_ids = {tag_id for tag_id in tag_ids if tag_id.hex in cached_tag_hexes}
+
+    uncached_category_id = category_id if category_id and not cached_category else None
+    uncached_tag_ids = [tag_id for tag_id in tag_ids if tag_id not in found_tag_ids]
+    if not uncached_category_id and not uncached_tag_ids:
+        return cached_category, found_tag_ids
+
+    statements = []
+    if uncached_category_id:
+        statements.append(select(literal("category").label("kind"), CategoryModel.id).where(CategoryModel.id == uncached_category_id))
+    if uncached_tag_ids:
+        statements.append(select(literal("tag").label("kind"), TagModel.id).where(TagModel.id.in_(uncached_tag_ids)))
+
+    stmt = union_all(*statements) if len(statements) > 1 else statements[0]
+    rows = (await session.execute(stmt)).all()
+    db_category = any(kind == "category" for kind, _ in rows)
+    db_tag_ids = {row_id for kind, row_id in rows if kind == "tag"}
+
+    await cache_manager.add_known_category_and_tags(category_id=uncached_category_id.hex if db_category else None, tag_ids=(tag_id.hex for tag_id in db_tag_ids))
+    return cached_category or db_category, found_tag_ids | db_tag_ids
+
+
+async def _commit_feed(session: AsyncSession) -> None:
+    """Commit a feed write; an id that passed the cached check but was deleted since fails its FK and is answered as a 400."""
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        await session.rollback()
+        # The known-id sets are only a shortcut; drop them so the next request checks the DB again
+        await cache_manager.forget_known_category_and_tags()
+        raise ValidationException(detail="Referenced category, tag or feed does not exist.") from e
+
+
 async def cleanup_temp_files(paths: list):
     for path in paths:
         try:
             if path.exists():
                 path.unlink()
-                my_logger.debug(f"Deleted temp file: {path}")
+                my_logger.debug("Deleted temp file: {}", path)
         except Exception as cleanup_error:
             my_logger.error(f"Failed to delete temp file {path}: {cleanup_error}")
 
 
+def _changed_fields(feed: FeedModel, **values: Any) -> dict[str, Any]:
+    """Return the given values that are set and differ from what the feed currently holds."""
+    return {key: value for key, value in values.items() if value is not None and getattr(feed, key) != value}
+
+
+async def _save_feed_media(user_id: str, image_file: Optional[UploadFile], video_file: Optional[UploadFile]) -> tuple[dict[str, str], bool]:
+    """Upload image and video concurrently; if either fails, remove whatever the other one stored and re-raise.
+
+    Returns the stored object names by feed field and whether the video still needs the faststart remux, which callers enqueue after their commit.
+    """
+    uploads = {}
+    if image_file:
+        uploads["image_url"] = validate_and_save_image(user_id=user_id, image_file=image_file)
+    if video_file:
+        uploads["video_url"] = validate_and_save_video(user_id=user_id, video_file=video_file)
+    if not uploads:
+        return {}, False
+
+    # return_exceptions lets the sibling finish instead of running on unobserved, so its object is known and can be removed
+    results = await asyncio.gather(*uploads.values(), return_exceptions=True)
+    media: dict[str, str] = {}
+    needs_faststart = False
+    for field, result in zip(uploads, results):
+        if isinstance(result, tuple):
+            result, needs_faststart = result
+        if isinstance(result, str):
+            media[field] = result
+
+    if errors := [result for result in results if isinstance(result, BaseException)]:
+        if media:
+            await remove_objects_from_minio(object_names=list(media.values()))
+        raise errors[0]
+    return media, needs_faststart
+
+
 async def validate_and_save_image(user_id: str, image_file: UploadFile) -> str:
     ext = get_file_extension(file=image_file)
     if ext not in allowed_image_extension:
         raise ValidationException(detail="Only PNG, JPG, and JPEG formats are allowed for feed images")
-    content = await image_file.read()
-    if len(content) > 4 * 1024 * 1024:
+    if image_file.size is not None and image_file.size > MAX_FEED_IMAGE_SIZE:
         raise ValidationException(detail="Feed image size exceeded limit 4MB.")
-    return await put_object_to_minio(object_name=f"users/{user_id}/feed_images/{image_file.filename}", data=content, content_type=image_file.content_type)
 
+    # Read in chunks so an oversized upload is rejected before it is fully buffered
+    content = bytearray()
+    while chunk := await image_file.read(UPLOAD_CHUNK_SIZE):
+        content += chunk
+        if len(content) > MAX_FEED_IMAGE_SIZE:
+            raise ValidationException(detail="Feed image size exceeded limit 4MB.")
+
+    # Every upload gets its own object, so deleting one feed's media never touches another feed's
+    object_name = f"users/{user_id}/feed_images/{uuid4().hex}.{ext}"
+    return await put_object_to_minio(object_name=object_name, data=bytes(content), content_type=image_file.content_type)
 
-async def validate_and_save_video(user_id: str, video_file: UploadFile) -> str:
-    temp_folder = settings.TEMP_VIDEOS_FOLDER_PATH
-    faststart_folder = temp_folder / "faststart"
-    temp_folder.mkdir(parents=True, exist_ok=True)
-    faststart_folder.mkdir(parents=True, exist_ok=True)
+
+async def validate_and_save_video(user_id: str, video_file: UploadFile) -> tuple[str, bool]:
+    faststart_folder = settings.TEMP_VIDEOS_FOLDER_PATH / "faststart"
 
     if video_file.filename is None:
         raise ValidationException(detail="filename is not set.")
 
-    temp_video_path = temp_folder / video_file.filename
-    faststart_video_path = faststart_folder / video_file.filename
+    # Temp files get a random name so concurrent uploads of "video.mp4" do not share a path
+    ext = get_file_extension(file=video_file)
+    faststart_video_path = faststart_folder / f"{uuid4().hex}.{ext}"
 
     try:
-        ext = get_file_extension(file=video_file)
         if ext not in allowed_video_extension:
             raise ValidationException("Unsupported video format provided.")
+        if video_file.size is not None and video_file.size > MAX_FEED_VIDEO_SIZE:
+            raise ValidationException("Video size exceeded limit 500MB.")
 
-        async with aiofiles.open(faststart_video_path, mode="wb") as out_file:
-            content = await video_file.read()
-            await out_file.write(content)
-            await out_file.flush()
+        # Plain buffered file whose open, writes and close (which flushes the last partial buffer) all run on a worker thread;
+        # avoids the aiofiles wrapper around the same threaded calls
+        written = 0
+        out_file = await asyncio.to_thread(open, faststart_video_path, "wb", VIDEO_CHUNK_SIZE)
+        try:
+            while chunk := await video_file.read(VIDEO_CHUNK_SIZE):
+                written += len(chunk)
+                if written > MAX_FEED_VIDEO_SIZE:
+                    raise ValidationException("Video size exceeded limit 500MB.")
+                await asyncio.to_thread(out_file.write, chunk)
+        finally:
+            await asyncio.to_thread(out_file.close)
 
         duration = await get_video_duration_using_ffprobe(str(faststart_video_path))
         if duration > 220:
             raise ValidationException("Video exceeds max allowed duration (220 seconds).")
 
-        ffmpeg = FFmpeg().input(str(faststart_video_path)).output(str(temp_video_path), c="copy", movflags="faststart")
-        await ffmpeg.execute()
+        # Per-upload name, like images: no two feeds share a video object, and the in-place remux below is safe to run
+        object_name = f"users/{user_id}/feed_videos/{uuid4().hex}.{ext}"
+        await put_file_to_minio(object_name=object_name, file_path=faststart_video_path, content_type=video_file.content_type)
 
-        return await put_file_to_minio(object_name=f"users/{user_id}/feed_videos/{video_file.filename}", file_path=temp_video_path, content_type=video_file.content_type)
+        # faststart needs a seekable output, so the remux cannot be piped; when moov trails mdat a worker rewrites the object in place.
+        # Only reported here: the task is enqueued by the route once the feed referencing the object is committed
+        needs_faststart = not await asyncio.to_thread(is_faststart_mp4, str(faststart_video_path))
+        return object_name, needs_faststart
 
     finally:
-        await cleanup_temp_files([temp_video_path, faststart_video_path])
+        await cleanup_temp_files([faststart_video_path])
 
 
 def validate_feed_create_fields():
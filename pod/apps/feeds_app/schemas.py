@@ -1,21 +1,19 @@
-from datetime import datetime
 from typing import Optional
-from uuid import UUID
 
 from pydantic import BaseModel
 
 from utility.my_enums import FeedVisibility, CommentPolicy
+from utility.my_types import HexUUID, UnixTs
 
 
 class AuthorSchema(BaseModel):
-    id: UUID
+    id: HexUUID
     name: str
     username: str
     avatar_url: Optional[str] = None
 
     class Config:
         from_attributes = True
-        json_encoders = {UUID: lambda v: v.hex, datetime: lambda v: int(v.timestamp()) if v is not None else None}
 
 
 class EngagementSchema(BaseModel):
@@ -47,25 +45,24 @@ class TagSchema(BaseModel):
 
 
 class FeedSchema(BaseModel):
-    id: UUID
-    created_at: datetime
-    updated_at: datetime
+    id: HexUUID
+    created_at: UnixTs
+    updated_at: UnixTs
     body: str
     author: AuthorSchema
     video_url: Optional[str] = None
     image_url: Optional[str] = None
-    scheduled_at: Optional[datetime] = None
+    scheduled_at: Optional[UnixTs] = None
     feed_visibility: FeedVisibility
     comment_policy: CommentPolicy
-    quote_id: Optional[UUID] = None
-    parent_id: Optional[UUID] = None
+    quote_id: Optional[HexUUID] = None
+    parent_id: Optional[HexUUID] = None
     category: Optional[CategorySchema] = None
     tags: list[TagSchema] = []
     engagement: Optional[EngagementSchema] = None
 
     class Config:
         from_attributes = True
-        json_encoders = {UUID: lambda v: v.hex, datetime: lambda v: int(v.timestamp()) if v is not None else None}
 
 
 class FeedResponseSchema(BaseModel):
@@ -1,47 +1,56 @@
 import asyncio
 from typing import Annotated, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from ffmpeg.asyncio import FFmpeg
 from redis.asyncio import Redis
-from sqlalchemy import select, and_
+from sqlalchemy import and_, func, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from taskiq import TaskiqDepends
 
 from apps.feeds_app.models import EngagementModel
+from settings.my_config import get_settings
 from settings.my_database import get_session
+from settings.my_minio import get_file_from_minio, put_file_to_minio
 from settings.my_redis import cache_manager, pubsub_manager, my_cache_redis
 from settings.my_taskiq import broker
 from utility.my_enums import PubSubTopics, EngagementType
 from utility.my_logger import my_logger
 
+settings = get_settings()
+
 
 @broker.task(task_name="notify_followers_task")
 async def notify_followers_task(user_id: str):
-    my_logger.warning(f"user_id: {user_id}")
-    avatar_url: Optional[str] = await cache_manager.get_profile_avatar_url(user_id=user_id)
-    my_logger.warning(f"avatar_url: {avatar_url}")
-    follower_ids = await cache_manager.get_followers(user_id=user_id)
-    my_logger.warning(f"follower_ids: {follower_ids}")
-    online_users = await cache_manager.get_users_from_feeds()
-    my_logger.warning(f"online_users: {online_users}")
+    # Followers that are online are intersected inside Redis instead of pulling both sets into the worker
+    avatar_url, online_followers = await asyncio.gather(cache_manager.get_profile_avatar_url(user_id=user_id), cache_manager.get_online_followers(user_id=user_id))
 
-    online_followers = [fid for fid in follower_ids if fid in online_users]
-    my_logger.warning(f"online_followers: {online_followers}")
+    data = {"user_id": user_id, "avatar_url": avatar_url if avatar_url else 'defaults/default-avatar.jpg', "event": "new_feed"}
+    await pubsub_manager.publish_many(topics=[PubSubTopics.FEEDS.value.format(follower_id=follower_id) for follower_id in online_followers], data=data)
 
-    async def notify(follower_id: str):
-        topic = PubSubTopics.FEEDS.value.format(follower_id=follower_id)
-        await pubsub_manager.publish(topic=topic, data={"user_id": user_id, "avatar_url": avatar_url if avatar_url else 'defaults/default-avatar.jpg', "event": "new_feed"})
+    my_logger.info(f"📣 Notified {len(online_followers)} followers of {user_id}")
 
-    tasks = [notify(follower_id) for follower_id in online_followers]
-    await asyncio.gather(*tasks)
 
-    my_logger.info(f"📣 Notified {len(online_followers)} followers of {user_id}")
+@broker.task(task_name="faststart_video_task")
+async def faststart_video_task(object_name: str, content_type: Optional[str] = None):
+    # Remux is a plain stream copy that moves moov in front of mdat; the object keeps its name, so feed.video_url never changes
+    ext = object_name.rsplit(".", maxsplit=1)[-1]
+    source_path = settings.TEMP_VIDEOS_FOLDER_PATH / f"{uuid4().hex}.{ext}"
+    output_path = settings.TEMP_VIDEOS_FOLDER_PATH / f"{uuid4().hex}.{ext}"
+    try:
+        await get_file_from_minio(object_name=object_name, file_path=source_path)
+        await FFmpeg().input(str(source_path)).output(str(output_path), c="copy", movflags="faststart").execute()
+        await put_file_to_minio(object_name=object_name, file_path=output_path, content_type=content_type)
+    finally:
+        source_path.unlink(missing_ok=True)
+        output_path.unlink(missing_ok=True)
 
 
 # @broker.task(task_name="recalculate_feed_stats", schedule=[{"cron": "*/360 * * * *"}])
 @broker.task(task_name="notify_followers_task")
 async def recalculate_feed_stats(cache: Annotated[Redis, TaskiqDepends(lambda: my_cache_redis)]):
-    my_logger.debug(f"recalculate_feed_stats starting...")
+    my_logger.debug("recalculate_feed_stats starting...")
     # my_logger.debug(f"cache users count: {await cache.hget(name='users', key='count')}")
     # await cache.hincrby(name="users", key="count")
     # TODO get feeds
@@ -49,24 +58,32 @@ async def recalculate_feed_stats(cache: Annotated[Redis, TaskiqDepends(lambda: m
     return {"ok": True}
 
 
+# Engagement kinds persisted as columns of the (user, feed) row; quotes live on feed_table.quote_id
+_ENGAGEMENT_COLUMNS = {
+    EngagementType.reposts: "reposted",
+    EngagementType.likes: "liked",
+    EngagementType.bookmarks: "bookmarked",
+    EngagementType.views: "viewed_at",
+}
+
+
 @broker.task(task_name="set_engagement_task")
 async def set_engagement_task(user_id: str, feed_id: str, engagement_type: EngagementType, session: Annotated[AsyncSession, TaskiqDepends(get_session)]):
-    if feed_id is not None:
-        if engagement_type == EngagementType.quotes:
-            return
-        engagement = EngagementModel(user_id=user_id, feed_id=feed_id, engagement_type=engagement_type)
-        session.add(instance=engagement)
-        await session.commit()
+    column: Optional[str] = _ENGAGEMENT_COLUMNS.get(engagement_type)
+    if feed_id is None or column is None:
+        return
+    value = func.now() if engagement_type == EngagementType.views else True
+    stmt = insert(EngagementModel).values(user_id=UUID(hex=user_id), feed_id=UUID(hex=feed_id), **{column: value}).on_conflict_do_update(constraint="uq_feed_engagement", set_={column: value})
+    await session.execute(stmt)
+    await session.commit()
 
 
 @broker.task(task_name="remove_engagement_task")
 async def remove_engagement_task(user_id: str, feed_id: str, engagement_type: EngagementType, session: Annotated[AsyncSession, TaskiqDepends(get_session)]):
-    if feed_id is not None:
-        if engagement_type == EngagementType.quotes:
-            return
-        stmt = select(EngagementModel).where(
-            and_(EngagementModel.user_id == UUID(hex=user_id), EngagementModel.feed_id == UUID(hex=feed_id), EngagementModel.engagement_type == engagement_type))
-        result = await session.execute(stmt)
-        engagement: Optional[EngagementModel] = result.scalar_one_or_none()
-        await session.delete(instance=engagement)
-        await session.commit()
+    column: Optional[str] = _ENGAGEMENT_COLUMNS.get(engagement_type)
+    if feed_id is None or column is None:
+        return
+    value = None if engagement_type == EngagementType.views else False
+    stmt = update(EngagementModel).where(and_(EngagementModel.user_id == UUID(hex=user_id), EngagementModel.feed_id == UUID(hex=feed_id))).values(**{column: value})
+    await session.execute(stmt)
+    await session.commit()
@@ -277,7 +277,7 @@ async def update_profile_route(jwt: strictJwtDependency, session: DBSession, sch
 
         return {"ok": True}
     except Exception as e:
-        my_logger.debug(f"Exception e: {e}")
+        my_logger.debug("Exception e: {}", e)
         raise ValidationException(detail=str(e))
 
 
@@ -335,7 +335,7 @@ async def update_profile_route(jwt: strictJwtDependency, session: DBSession, ava
 
         return {"avatar_url": user.avatar_url, "banner_url": user.banner_url}
     except Exception as e:
-        my_logger.debug(f"Exception e: {e}")
+        my_logger.debug("Exception e: {}", e)
         raise ValidationException(detail=str(e))
 
 
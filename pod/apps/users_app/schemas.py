@@ -1,12 +1,12 @@
 import re
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from uuid import UUID
 
 from pydantic import BaseModel, field_validator
 
 from settings.my_exceptions import ValidationException
 from utility.my_enums import FollowPolicy, UserRole, UserStatus
+from utility.my_types import HexUUID, UnixTs
 from utility.validators import validate_email, validate_length, validate_password, validate_username, violent_words_regex
 
 
@@ -92,9 +92,9 @@ class ResetPasswordSchema(BaseModel):
 
 
 class ProfileSchema(BaseModel):
-    id: UUID
-    created_at: datetime
-    updated_at: datetime
+    id: HexUUID
+    created_at: UnixTs
+    updated_at: UnixTs
     name: Optional[str] = None
     username: str
     email: str
@@ -102,7 +102,7 @@ class ProfileSchema(BaseModel):
     avatar_url: Optional[str] = None
     banner_url: Optional[str] = None
     banner_color: Optional[str] = None
-    birthdate: Optional[datetime] = None
+    birthdate: Optional[UnixTs] = None
     bio: Optional[str] = None
     country: Optional[str] = None
     city: Optional[str] = None
@@ -115,7 +115,6 @@ class ProfileSchema(BaseModel):
 
     class Config:
         from_attributes = True
-        json_encoders = {UUID: lambda v: v.hex, datetime: lambda v: int(v.timestamp()) if v is not None else None}
 
 
 class ProfileUpdateSchema(BaseModel):
@@ -123,7 +122,7 @@ class ProfileUpdateSchema(BaseModel):
     username: Optional[str] = None
     email: Optional[str] = None
     password: Optional[str] = None
-    birthdate: Optional[datetime] = None
+    birthdate: Optional[UnixTs] = None
     bio: Optional[str] = None
     country: Optional[str] = None
     city: Optional[str] = None
@@ -134,7 +133,6 @@ class ProfileUpdateSchema(BaseModel):
     class Config:
         use_enum_values = True
         from_attributes = True
-        json_encoders = {UUID: lambda v: v.hex, datetime: lambda v: int(v.timestamp()) if v is not None else None}
 
     @field_validator("username")
     def validate_username(cls, value: Optional[str]):
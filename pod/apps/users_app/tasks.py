@@ -9,7 +9,7 @@ from apps.users_app.models import FollowModel, UserModel
 from services.zepto_service import ZeptoMail
 from settings.my_database import get_session
 from settings.my_exceptions import NotFoundException
-from settings.my_redis import pubsub_manager
+from settings.my_redis import cache_manager, pubsub_manager
 from settings.my_taskiq import broker
 from utility.my_enums import FollowPolicy, FollowStatus, PubSubTopics
 from utility.my_logger import my_logger
@@ -23,7 +23,7 @@ async def send_email_task(
         for_reset_password: bool = False,
         for_thanks_signing_up: bool = False,
 ):
-    my_logger.debug(f"send_email_task is starting")
+    my_logger.debug("send_email_task is starting")
     zepto = ZeptoMail()
     await zepto.send_email(to_email, username, code, for_reset_password, for_thanks_signing_up)
 
@@ -32,7 +32,8 @@ async def send_email_task(
 
 @broker.task(task_name="notify_settings_stats")
 async def notify_settings_stats():
-    await pubsub_manager.publish(topic=PubSubTopics.SETTINGS_STATS.value, data={})
+    statistics = await cache_manager.get_statistics()
+    await pubsub_manager.publish(topic=PubSubTopics.SETTINGS_STATS.value, data=statistics.model_dump())
     my_logger.info("📊 Settings statistics published to all instances.")
 
     return {"ok": True}
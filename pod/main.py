@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 import taskiq_fastapi
@@ -7,7 +8,7 @@ from fastapi.responses import JSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from apps.admin_app.routes import admin_router
-from apps.admin_app.ws import admin_ws_router
+from apps.admin_app.ws import admin_ws_router, statistics_fanout
 from apps.chats_app.routes import chats_router
 from apps.chats_app.ws import chat_ws_router
 from apps.feeds_app.routes import feed_router
@@ -17,29 +18,39 @@ from services.firebase_service import initialize_firebase
 from settings.my_config import get_settings
 from settings.my_database import initialize_db
 from settings.my_exceptions import ApiException
-from settings.my_redis import initialize_redis_indexes
+from settings.my_http import close_http_session
+from settings.my_redis import close_redis, initialize_redis_indexes
 from settings.my_taskiq import broker
 from utility.my_logger import my_logger
+from utility.orjson_response import ORJSONResponse
 
 settings = get_settings()
 
 
 @asynccontextmanager
 async def app_lifespan(_app: FastAPI):
+    (settings.TEMP_VIDEOS_FOLDER_PATH / "faststart").mkdir(parents=True, exist_ok=True)
     await initialize_redis_indexes()
     await initialize_db()
     initialize_firebase()
     instrumentator.expose(_app)
+    fanout_task = None
     if not broker.is_worker_process:
-        print("Starting broker")
+        my_logger.info("Starting broker")
         await broker.startup()
+        fanout_task = asyncio.create_task(statistics_fanout())
     yield
     if not broker.is_worker_process:
-        print("Shutting down broker")
+        my_logger.info("Shutting down broker")
+        fanout_task.cancel()
+        await asyncio.gather(fanout_task, return_exceptions=True)
         await broker.shutdown()
+    await close_redis()
+    await close_http_session()
+    await my_logger.complete()
 
 
-app: FastAPI = FastAPI(lifespan=app_lifespan)
+app: FastAPI = FastAPI(lifespan=app_lifespan, default_response_class=ORJSONResponse)
 instrumentator = Instrumentator().instrument(app)
 
 taskiq_fastapi.init(broker=broker, app_or_path=app)
@@ -51,6 +62,12 @@ async def api_exception_handler(request: Request, exception: ApiException):
     return JSONResponse(status_code=exception.status_code, content={"details": exception.detail}, headers=exception.headers)
 
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exception: Exception):
+    my_logger.exception(f"Unhandled error during {request.method} {request.url.path}: {exception}")
+    return ORJSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content={"details": "Something went wrong, please try again later."})
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exception: RequestValidationError):
     details = []
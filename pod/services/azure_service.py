@@ -1,7 +1,7 @@
 from typing import Dict, List
 
-import aiohttp
 from settings.my_config import get_settings
+from settings.my_http import get_http_session
 
 
 async def azure_translate_text(texts: List[str], from_lang: str = "en", to_lang: str = "uz") -> List[Dict]:
@@ -16,13 +16,12 @@ async def azure_translate_text(texts: List[str], from_lang: str = "en", to_lang:
     params = {"api-version": "3.0", "from": from_lang, "to": to_lang}
     body = [{"text": text} for text in texts]
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(get_settings().AZURE_TRANSLATOR_ENDPOINT, params=params, headers=headers, json=body) as response:
-            if response.status == 200:
-                return await response.json()
-            else:
-                error_message = await response.text()
-                raise Exception(f"Translation API Error: {error_message}")
+    async with get_http_session().post(get_settings().AZURE_TRANSLATOR_ENDPOINT, params=params, headers=headers, json=body) as response:
+        if response.status == 200:
+            return await response.json()
+        else:
+            error_message = await response.text()
+            raise Exception(f"Translation API Error: {error_message}")
 
 
 # from typing import Optional
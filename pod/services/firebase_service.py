@@ -15,7 +15,7 @@ def initialize_firebase():
     try:
         cred = credentials.Certificate(cert=settings.firebase_adminsdk)
         default_app = initialize_app(credential=cred)
-        my_logger.debug(f"firebase default_app.project_id: {default_app.project_id}, default_app.name: {default_app.name}")
+        my_logger.debug("firebase default_app.project_id: {}, default_app.name: {}", default_app.project_id, default_app.name)
     except Exception as e:
         my_logger.exception(f"initialization error: {e}")
 
@@ -27,7 +27,7 @@ async def validate_firebase_token(firebase_id_token: str) -> UserRecord:
     try:
         # Verify the token asynchronously
         decoded_token: dict = await asyncio.to_thread(partial(auth.verify_id_token, firebase_id_token))
-        print(f"🔨 decoded_token in validate_firebase_token: {decoded_token}")
+        my_logger.debug("decoded_token in validate_firebase_token: {}", decoded_token)
 
         # Retrieve user information from Firebase
         user = await asyncio.to_thread(partial(auth.get_user, decoded_token.get("uid")))
@@ -1,5 +1,6 @@
-import aiohttp
 from settings.my_config import get_settings
+from settings.my_http import get_http_session
+from utility.my_logger import my_logger
 
 
 class ZeptoMail:
@@ -19,10 +20,9 @@ class ZeptoMail:
         if for_thanks_signing_up:
             payload.update({"template_alias": "kronk-thanks-for-signing-up-key-alias", "from": {"address": "thanks@kronk.uz", "name": "thanks"}})
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url=ZeptoMail.API_URL, json=payload, headers=ZeptoMail.HEADERS) as response:
-                    return {"status": response.status, "message": (await response.json())["message"]}
-            except Exception as e:
-                print(f"🌋 Exception in ZeptoMail send_email: {e}")
-                return {"status": "🌋"}
+        try:
+            async with get_http_session().post(url=ZeptoMail.API_URL, json=payload, headers=ZeptoMail.HEADERS) as response:
+                return {"status": response.status, "message": (await response.json())["message"]}
+        except Exception as e:
+            my_logger.exception("Exception in ZeptoMail send_email: {}", e)
+            return {"status": "🌋"}
@@ -12,7 +12,18 @@ from utility.my_logger import my_logger
 
 settings = get_settings()
 
-async_engine: AsyncEngine = create_async_engine(settings.DATABASE_URL, echo=False, connect_args={"ssl": True})
+# One engine per process; the pool keeps warm TLS connections so HTTP and WebSocket bursts skip the handshake
+async_engine: AsyncEngine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=False,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+    connect_args={"ssl": True, "statement_cache_size": 1024},
+)
 async_session = async_sessionmaker(async_engine, expire_on_commit=False, class_=AsyncSession)
 
 
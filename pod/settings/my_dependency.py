@@ -8,6 +8,7 @@ from fastapi import Depends, Header, WebSocket, WebSocketException, status
 
 from settings.my_config import get_settings
 from settings.my_exceptions import ApiException, JWTDecodeException, JWTExpiredException, JWTSignatureException, UnauthorizedException
+from utility.my_logger import my_logger
 
 settings = get_settings()
 
@@ -107,7 +108,8 @@ def verify_jwt_token(token: str) -> JWTCredential:
     except (DecodeError, InvalidTokenError, KeyMismatchError) as e:
         raise JWTDecodeException(detail=str(e))
     except Exception as e:
-        raise ApiException(status_code=401, detail=f"Unknown JWT error, {e}")
+        my_logger.exception("Unknown JWT error")
+        raise ApiException(status_code=401, detail="Unknown JWT error") from e
 
 
 headerTokenDependency = Annotated[HeaderTokensCredential, Depends(dependency=header_tokens_resolver)]
@@ -0,0 +1,18 @@
+from typing import Optional
+
+import aiohttp
+
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Process-wide aiohttp session, created lazily so API and worker processes both reuse pooled connections."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession()
+    return _http_session
+
+
+async def close_http_session() -> None:
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
@@ -3,9 +3,9 @@ from io import BytesIO
 from pathlib import Path
 from typing import Optional
 
-import aiohttp
 from miniopy_async.api import Minio
 from miniopy_async.datatypes import Object
+from miniopy_async.deleteobjects import DeleteObject
 # from miniopy_async.datatypes import ListObjects, Object
 from miniopy_async.helpers import ObjectWriteResult
 
@@ -29,19 +29,26 @@ async def minio_ready() -> bool:
             await minio_client.set_bucket_policy("my-bucket", json.dumps(policy))
         return True
     except Exception as e:
-        print(f"🌋 Failed in check_if_bucket_exists: {e}")
+        my_logger.exception("Failed in check_if_bucket_exists: {}", e)
         return False
 
 
 async def get_object_from_minio(object_name: str) -> bytes:
     try:
-        async with aiohttp.ClientSession():
-            return await (await minio_client.get_object(bucket_name=settings.S3_BUCKET_NAME, object_name=object_name)).read()
+        return await (await minio_client.get_object(bucket_name=settings.S3_BUCKET_NAME, object_name=object_name)).read()
     except Exception as e:
-        print(f"Exception in get_data_from_minio: {e}")
+        my_logger.exception("Exception in get_data_from_minio: {}", e)
         raise ValueError("Exception in get_data_from_minio: {e}")
 
 
+async def get_file_from_minio(object_name: str, file_path: Path) -> None:
+    try:
+        await minio_client.fget_object(bucket_name=settings.S3_BUCKET_NAME, object_name=object_name, file_path=str(file_path))
+    except Exception as e:
+        my_logger.exception("Exception in get_file_from_minio: {}", e)
+        raise ValueError(f"Exception in get_file_from_minio: {e}")
+
+
 async def put_object_to_minio(object_name: str, data: bytes, content_type: str, old_object_name: Optional[str] = None, for_update: bool = False) -> str:
     try:
         if for_update and old_object_name:
@@ -52,7 +59,7 @@ async def put_object_to_minio(object_name: str, data: bytes, content_type: str,
 
         return result.object_name
     except Exception as e:
-        print(f"Exception in put_data_to_minio: {e}")
+        my_logger.exception("Exception in put_data_to_minio: {}", e)
         raise ValueError(f"Exception in put_data_to_minio: {e}")
 
 
@@ -66,26 +73,27 @@ async def put_file_to_minio(object_name: str, file_path: Path, content_type: str
 
         return result.object_name
     except Exception as e:
-        print(f"Exception in put_file_to_minio: {e}")
+        my_logger.exception("Exception in put_file_to_minio: {}", e)
         raise ValueError(f"Exception in put_file_to_minio: {e}")
 
 
 async def remove_objects_from_minio(object_names: list[str]) -> None:
     try:
-        my_logger.debug(f"remove_objects_from_minio; object_names: {object_names}")
-        for object_name in object_names:
-            await minio_client.remove_object(bucket_name=settings.S3_BUCKET_NAME, object_name=object_name)
+        my_logger.debug("remove_objects_from_minio; object_names: {}", object_names)
+        # Multi-object DELETE: the client sends batches of up to 1000 keys per request instead of one request per object
+        errors = await minio_client.remove_objects(bucket_name=settings.S3_BUCKET_NAME, delete_object_list=[DeleteObject(name=object_name) for object_name in object_names])
+        for error in errors:
+            my_logger.error(f"Failed to remove {error.name} from minio: {error.message}")
     except Exception as e:
-        print(f"Exception in remove_object_from_minio: {e}")
+        my_logger.exception("Exception in remove_object_from_minio: {}", e)
 
 
 async def wipe_objects_from_minio(user_id: str) -> None:
     try:
         list_objects: list[Object] = await minio_client.list_objects(bucket_name=settings.S3_BUCKET_NAME, prefix=f"users/{user_id}/", recursive=True)
-        for user_object in list_objects:
-            await remove_objects_from_minio(object_names=[f"{user_object.object_name}"])
+        await remove_objects_from_minio(object_names=[user_object.object_name for user_object in list_objects])
     except Exception as e:
-        print(f"Exception in wipe_objects_from_minio: {e}")
+        my_logger.exception("Exception in wipe_objects_from_minio: {}", e)
         raise ValueError(f"Exception in wipe_objects_from_minio: {e}")
 
 
@@ -1,32 +1,37 @@
-import json
 import math
 import time
 from datetime import date, datetime, timedelta, timezone, UTC
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 from uuid import uuid4, UUID
 
+import orjson
 from coredis import PureToken
 from coredis import Redis as SearchRedis
 from coredis.exceptions import ResponseError
 from coredis.modules.response.types import SearchResult
 from coredis.modules.search import Field
 from redis.asyncio import Redis as CacheRedis
-from redis.asyncio.client import PubSub
+from redis.asyncio.client import Pipeline, PubSub
 
 from apps.chats_app.schemas import ChatSchema, ParticipantSchema, ChatResponseSchema, ChatMessageSchema
+from apps.feeds_app.schemas import FeedSchema
 from settings.my_config import get_settings
 from utility.my_enums import EngagementType
 from utility.my_logger import my_logger
 from utility.my_types import StatisticsSchema
+from utility.orjson_response import orjson_dumps
 from utility.validators import escape_redisearch_special_chars
 
 settings = get_settings()
 
+# Process-wide client: every manager below shares this one connection pool, never open a per-request Redis(...)
 my_cache_redis: CacheRedis = CacheRedis(
     host=settings.REDIS_HOST,
     password=settings.REDIS_PASSWORD,
     db=0,
+    protocol=3,
     decode_responses=True,
+    max_connections=100,
     auto_close_connection_pool=True,
     ssl=True,
     ssl_ca_certs="ca.pem",
@@ -58,10 +63,14 @@ async def redis_ready() -> bool:
         await my_search_redis.ping()
         return True
     except Exception as e:
-        print(f"🌋 Failed in redis_om_ready: {e}")
+        my_logger.exception("Failed in redis_om_ready: {}", e)
         return False
 
 
+async def close_redis() -> None:
+    await my_cache_redis.aclose()
+
+
 async def initialize_redis_indexes() -> None:
     try:
         await my_search_redis.search.create(
@@ -80,13 +89,69 @@ async def initialize_redis_indexes() -> None:
             raise
 
 
+# Reads a page of a user's chats together with each chat's meta, last message, the other participant's profile
+# and online flag in a single round trip. KEYS[1] = users:{user_id}:chats, ARGV = start, end, user_id
+GET_CHATS_SCRIPT = """
+local chat_ids = redis.call('ZREVRANGE', KEYS[1], ARGV[1], ARGV[2])
+local chats = {}
+for _, chat_id in ipairs(chat_ids) do
+    local participant_id = nil
+    for _, pid in ipairs(redis.call('SMEMBERS', 'chats:' .. chat_id .. ':participants')) do
+        if pid ~= ARGV[3] then
+            participant_id = pid
+            break
+        end
+    end
+    if participant_id then
+        table.insert(chats, {
+            meta = redis.call('HGETALL', 'chats:' .. chat_id .. ':meta'),
+            last_message = redis.call('HGETALL', 'chats:' .. chat_id .. ':last_message'),
+            participant_id = participant_id,
+            profile = redis.call('HGETALL', 'users:' .. participant_id .. ':profile'),
+            is_online = redis.call('SISMEMBER', 'chats:online', participant_id),
+        })
+    end
+end
+return cjson.encode({chats = chats, count = #chat_ids})
+"""
+
+
+# Flips presence and returns every distinct participant of the user's chats in one round trip
+CHAT_PRESENCE_SCRIPT = """
+local user_id = ARGV[1]
+if ARGV[2] == 'online' then
+    redis.call('SADD', 'chats:online', user_id)
+else
+    redis.call('SREM', 'chats:online', user_id)
+    redis.call('HSET', 'users:' .. user_id .. ':profile', 'last_seen_at', ARGV[3])
+end
+local participant_ids = {}
+local seen = {}
+for _, chat_id in ipairs(redis.call('ZRANGE', KEYS[1], 0, -1)) do
+    for _, pid in ipairs(redis.call('SMEMBERS', 'chats:' .. chat_id .. ':participants')) do
+        if pid ~= user_id and not seen[pid] then
+            seen[pid] = true
+            table.insert(participant_ids, pid)
+        end
+    end
+end
+return participant_ids
+"""
+
 class RedisPubSubManager:
     def __init__(self, cache_redis: CacheRedis):
         self.cache_redis = cache_redis
         self.active_subscriptions: dict[str, PubSub] = {}
 
     async def publish(self, topic: str, data: dict):
-        await self.cache_redis.publish(channel=topic, message=json.dumps(data))
+        await self.cache_redis.publish(channel=topic, message=orjson_dumps(data))
+
+    async def publish_many(self, topics: Iterable[str], data: dict):
+        message = orjson_dumps(data)
+        async with self.cache_redis.pipeline(transaction=False) as pipe:
+            for topic in topics:
+                pipe.publish(channel=topic, message=message)
+            await pipe.execute()
 
     async def subscribe(self, topic: str) -> PubSub:
         pubsub = self.cache_redis.pubsub()
@@ -107,70 +172,68 @@ class ChatCacheManager:
     def __init__(self, cache_redis: CacheRedis, search_redis: SearchRedis):
         self.cache_redis = cache_redis
         self.search_redis = search_redis
+        self.get_chats_script = cache_redis.register_script(GET_CHATS_SCRIPT)
+        self.chat_presence_script = cache_redis.register_script(CHAT_PRESENCE_SCRIPT)
 
-    async def create_chat(self, user_id: str, participant_id: str, chat_id: str, mapping: dict):
+    async def create_chat(self, user_id: str, participant_id: str, chat_id: str, mapping: dict) -> tuple[Optional[dict], Optional[dict], bool]:
         last_message: dict = mapping.pop("last_message")
-        async with self.cache_redis.pipeline() as pipe:
-            pipe.zadd(name=f"users:{user_id}:chats", mapping={chat_id: datetime.now(UTC).timestamp()})
-            pipe.zadd(name=f"users:{participant_id}:chats", mapping={chat_id: datetime.now(UTC).timestamp()})
+        score = datetime.now(UTC).timestamp()
+        async with self.cache_redis.pipeline(transaction=False) as pipe:
+            pipe.zadd(name=f"users:{user_id}:chats", mapping={chat_id: score})
+            pipe.zadd(name=f"users:{participant_id}:chats", mapping={chat_id: score})
             pipe.hset(name=f"chats:{chat_id}:meta", mapping=mapping)
             pipe.hset(name=f"chats:{chat_id}:last_message", mapping=last_message)
             pipe.sadd(f"chats:{chat_id}:participants", user_id, participant_id)
-            await pipe.execute()
+            pipe.delete(f"chats:tiles:{user_id}", f"chats:tiles:{participant_id}")
+            pipe.hgetall(name=f"users:{participant_id}:profile")
+            pipe.hgetall(name=f"users:{user_id}:profile")
+            pipe.sismember(name="chats:online", value=participant_id)
+            results = await pipe.execute()
+
+        participant_profile, user_profile, is_online = results[-3:]
+        return participant_profile or None, user_profile or None, bool(is_online)
 
     async def delete_chat(self, participants: list[str], chat_id: str):
-        async with self.cache_redis.pipeline() as pipe:
+        async with self.cache_redis.pipeline(transaction=False) as pipe:
             for pid in participants:
                 pipe.zrem(f"users:{pid}:chats", chat_id)
-                pipe.delete(f"chats:{chat_id}:meta")
-                pipe.delete(f"chats:{chat_id}:last_message")
-            pipe.srem(f"chats:{chat_id}:participants", *participants)
+            pipe.delete(f"chats:{chat_id}:meta", f"chats:{chat_id}:last_message", f"chats:{chat_id}:participants", *[f"chats:tiles:{pid}" for pid in participants])
             await pipe.execute()
 
-    async def get_chats(self, user_id: str, start: int = 0, end: int = 20) -> ChatResponseSchema:
-        chat_ids: list[str] = await self.cache_redis.zrevrange(name=f"users:{user_id}:chats", start=start, end=end)
-        if not chat_ids:
-            return ChatResponseSchema(chats=[], end=0)
-
-        async with self.cache_redis.pipeline() as pipe:
-            for chat_id in chat_ids:
-                pipe.hgetall(f"chats:{chat_id}:meta")  # index 0, 3, 6...
-                pipe.hgetall(f"chats:{chat_id}:last_message")  # index 1, 4, 7...
-                pipe.smembers(f"chats:{chat_id}:participants")  # index 2, 5, 8...
-            results = await pipe.execute()
-
-        my_logger.warning(f"results: {results}")
+    async def get_cached_chats(self, user_id: str, start: int, end: int) -> Optional[str]:
+        return await self.cache_redis.hget(name=f"chats:tiles:{user_id}", key=f"{start}:{end}")
 
-        chats: list[dict] = results[::3]  # Every 3rd element starting at 0
-        last_messages: list[dict] = results[1::3]  # Every 3rd element starting at 1
-        participant_sets: list[set[str]] = results[2::3]  # Every 3rd element starting at 2
-
-        participant_ids: list[str] = []
-        for participant_set in participant_sets:
-            participant_set.discard(user_id)
-            pid: Optional[str] = next(iter(participant_set), None)
-            if not pid:
-                continue
-            participant_ids.append(pid)
+    async def set_cached_chats(self, user_id: str, start: int, end: int, payload: bytes, ttl: int = 5):
+        async with self.cache_redis.pipeline(transaction=False) as pipe:
+            pipe.hset(name=f"chats:tiles:{user_id}", key=f"{start}:{end}", value=payload)
+            # NX: the TTL is set once when the hash is created, so writing another page never extends older ones past ttl
+            pipe.expire(name=f"chats:tiles:{user_id}", time=ttl, nx=True)
+            await pipe.execute()
 
-        async with self.cache_redis.pipeline() as pipe:
-            for pid in participant_ids:
-                pipe.hgetall(f"users:{pid}:profile")
-            for pid in participant_ids:
-                pipe.sismember("chats:online", pid)
-            piped_results = await pipe.execute()
+    async def invalidate_cached_chats(self, user_ids: Iterable[str]):
+        if keys := [f"chats:tiles:{uid}" for uid in user_ids]:
+            await self.cache_redis.delete(*keys)
 
-        profiles: list[dict] = piped_results[:len(participant_ids)]
-        statuses: list[bool] = piped_results[len(participant_ids):]
+    async def get_chats(self, user_id: str, start: int = 0, end: int = 20) -> ChatResponseSchema:
+        raw: str = await self.get_chats_script(keys=[f"users:{user_id}:chats"], args=[start, end, user_id])
+        result: dict = orjson.loads(raw)
+        if not result["count"]:
+            # Past the last chat: keep the cursor at start so clients paging with `end` stop instead of wrapping to 0
+            return ChatResponseSchema.model_construct(chats=[], end=start)
 
         chat_list = []
-        for chat_meta, last_msg, pid, profile, is_online in zip(chats, last_messages, participant_ids, profiles, statuses):
-            if not pid or not profile:
+        # cjson encodes an empty Lua table as {}, so every list below may arrive as a dict
+        for row in result["chats"] or []:
+            chat_meta, last_msg, profile = _flat_to_dict(row["meta"]), _flat_to_dict(row["last_message"]), _flat_to_dict(row["profile"])
+            pid: str = row["participant_id"]
+            is_online = bool(row["is_online"])
+            if not profile:
                 continue
 
-            chat = ChatSchema(
-                id=chat_meta.get("id"),
-                participant=ParticipantSchema(
+            # Our own cache writes, converted to UUID/datetime right here, so validation is skipped
+            chat = ChatSchema.model_construct(
+                id=UUID(hex=chat_meta.get("id")),
+                participant=ParticipantSchema.model_construct(
                     id=UUID(hex=pid),
                     name=profile.get("name"),
                     username=profile.get("username"),
@@ -179,7 +242,7 @@ class ChatCacheManager:
                     is_online=is_online,
                 ),
                 last_activity_at=datetime.fromtimestamp(float(chat_meta.get("last_activity_at", time.time()))),
-                last_message=ChatMessageSchema(
+                last_message=ChatMessageSchema.model_construct(
                     id=UUID(hex=last_msg.get("id", "")),
                     sender_id=UUID(hex=last_msg.get("sender_id", "")),
                     chat_id=UUID(hex=last_msg.get("chat_id", "")),
@@ -189,7 +252,7 @@ class ChatCacheManager:
             )
             chat_list.append(chat)
 
-        return ChatResponseSchema(chats=chat_list, end=len(chat_ids) - 1)
+        return ChatResponseSchema.model_construct(chats=chat_list, end=result["count"] - 1)
 
     async def is_user_chat_owner(self, user_id: str, chat_id: str) -> bool:
         score: Optional[float] = await self.cache_redis.zscore(name=f"users:{user_id}:chats", value=chat_id)
@@ -201,19 +264,13 @@ class ChatCacheManager:
     ''' ****************************************** EVENTS ****************************************** '''
 
     async def add_user_to_chats(self, user_id: str) -> set[str]:
-        async with self.cache_redis.pipeline() as pipe:
-            pipe.sadd(f"chats:online", user_id)
-            pipe.zrevrange(name=f"users:{user_id}:chats", start=0, end=-1)
-            results = await pipe.execute()
-        return results[1]
+        participant_ids: list[str] = await self.chat_presence_script(keys=[f"users:{user_id}:chats"], args=[user_id, "online", ""])
+        return set(participant_ids)
 
     async def remove_user_from_chats(self, user_id: str) -> set[str]:
-        async with self.cache_redis.pipeline() as pipe:
-            pipe.srem(f"chats:online", user_id)
-            pipe.zrevrange(name=f"users:{user_id}:chats", start=0, end=-1)
-            pipe.hset(f"users:{user_id}:profile", key="last_seen_at", value=int(datetime.now(UTC).timestamp()))
-            results = await pipe.execute()
-        return results[1]
+        last_seen_at = int(datetime.now(UTC).timestamp())
+        participant_ids: list[str] = await self.chat_presence_script(keys=[f"users:{user_id}:chats"], args=[user_id, "offline", last_seen_at])
+        return set(participant_ids)
 
     async def add_typing(self, user_id: str, chat_id: str):
         await self.cache_redis.sadd(f"typing:{chat_id}", user_id)
@@ -306,7 +363,7 @@ class CacheManager:
 
             async with self.cache_redis.pipeline() as pipe:
                 # Save feed metadata
-                pipe.hset(name=f"feeds:{feed_id}:meta", mapping=mapping)
+                pipe.hset(name=f"feeds:{feed_id}:meta", mapping=_encode_feed_hash(mapping))
 
                 # Add to global timeline
                 pipe.zadd(name="global_timeline", mapping={feed_id: initial_score})
@@ -334,15 +391,16 @@ class CacheManager:
             my_logger.error(f"Exception while creating feed: {e}")
             raise ValueError(f"Exception while creating feed: {e}")
 
-    async def update_feed(self, feed_id: str, key: str, value: Any):
-        if value is None:
-            await self.cache_redis.hdel(f"feeds:{feed_id}:meta", key)
-            return
-        else:
-            if isinstance(value, list):
-                value = json.dumps(value)
-            await self.cache_redis.hset(name=f"feeds:{feed_id}:meta", key=key, value=value)
-            return
+    async def update_feed(self, feed_id: str, mapping: dict[str, Any]):
+        removed_keys = [key for key, value in mapping.items() if value is None]
+        updated = _encode_feed_hash({key: value for key, value in mapping.items() if value is not None})
+
+        async with self.cache_redis.pipeline(transaction=False) as pipe:
+            if removed_keys:
+                pipe.hdel(f"feeds:{feed_id}:meta", *removed_keys)
+            if updated:
+                pipe.hset(name=f"feeds:{feed_id}:meta", mapping=updated)
+            await pipe.execute()
 
     async def delete_feed(self, author_id: str, feed_id: str):
         my_logger.warning(f"Deleting feed: author_id={author_id}, feed_id={feed_id}")
@@ -439,11 +497,17 @@ class CacheManager:
                 pipe.hgetall(f"feeds:{feed_id}:meta")
             feed_metas: list[dict] = await pipe.execute()
 
-        # Process feed metadata
+        # Process feed metadata; hash values come back as strings, so restore the integer timestamps FeedSchema emits
         for feed_meta in feed_metas:
             if not feed_meta:
                 continue
 
+            for key in _FEED_TIMESTAMP_FIELDS:
+                if key in feed_meta:
+                    feed_meta[key] = int(float(feed_meta[key]))
+            for key in _FEED_JSON_FIELDS:
+                if key in feed_meta:
+                    feed_meta[key] = orjson.loads(feed_meta[key])
             feeds.append(feed_meta)
 
         # Process engagement results
@@ -485,22 +549,58 @@ class CacheManager:
 
         author_profiles = {profile[0]: dict(zip(keys, profile)) for profile in profiles if profile and profile[0]}
 
+        # Only FeedSchema's fields go out; storage-only keys such as author_id stay behind and null profile fields are dropped
+        shaped: list[dict] = []
         for feed in feeds:
-            feed["author"] = author_profiles.get(feed.pop("author_id"), {})
+            author = author_profiles.get(feed.pop("author_id", None))
+            if author is None:
+                my_logger.warning("Skipping feed {} whose author profile is not cached", feed["id"])
+                continue
+            feed["author"] = {key: value for key, value in author.items() if value is not None}
+            shaped.append({key: value for key, value in feed.items() if key in _FEED_FIELDS})
 
-        return feeds
+        return shaped
+
+    async def get_known_category_and_tags(self, category_id: Optional[str], tag_ids: list[str]) -> tuple[bool, set[str]]:
+        async with self.cache_redis.pipeline(transaction=False) as pipe:
+            if category_id:
+                pipe.sismember(name="categories:ids", value=category_id)
+            if tag_ids:
+                pipe.smismember("tags:ids", tag_ids)
+            results = await pipe.execute()
+
+        category_found = bool(results.pop(0)) if category_id else False
+        found_tag_ids = {tag_id for tag_id, found in zip(tag_ids, results[0]) if found} if tag_ids else set()
+        return category_found, found_tag_ids
+
+    async def add_known_category_and_tags(self, category_id: Optional[str], tag_ids: Iterable[str], ttl: int = 3600):
+        # nx keeps the first TTL, so an id removed from the DB drops out of the set within the hour
+        tag_ids = list(tag_ids)
+        async with self.cache_redis.pipeline(transaction=False) as pipe:
+            if category_id:
+                pipe.sadd("categories:ids", category_id)
+                pipe.expire(name="categories:ids", time=ttl, nx=True)
+            if tag_ids:
+                pipe.sadd("tags:ids", *tag_ids)
+                pipe.expire(name="tags:ids", time=ttl, nx=True)
+            await pipe.execute()
+
+    async def forget_known_category_and_tags(self):
+        await self.cache_redis.delete("categories:ids", "tags:ids")
 
     ''' ***************************************** INTERACTION ***************************************** '''
 
     async def set_engagement(self, user_id: str, feed_id: str, engagement_type: EngagementType, is_comment: bool = False):
         engagement_key, user_key = _engagement_keys(feed_id=feed_id, user_id=user_id, engagement_type=engagement_type, is_comment=is_comment)
 
+        # Write and read back the counters in the same round-trip
         async with self.cache_redis.pipeline() as pipe:
             pipe.sadd(engagement_key, user_id)
             pipe.sadd(user_key, feed_id)
-            await pipe.execute()
+            _queue_engagement_reads(pipe=pipe, user_id=user_id, feed_id=feed_id, is_comment=is_comment)
+            results = await pipe.execute()
 
-            return await self.get_engagement(user_id=user_id, feed_id=feed_id)
+        return _parse_engagement(results[2:])
 
     async def remove_engagement(self, user_id: str, feed_id: str, engagement_type: EngagementType, is_comment: bool = False):
         engagement_key, user_key = _engagement_keys(feed_id=feed_id, user_id=user_id, engagement_type=engagement_type, is_comment=is_comment)
@@ -508,34 +608,26 @@ class CacheManager:
         async with self.cache_redis.pipeline() as pipe:
             pipe.srem(engagement_key, user_id)
             pipe.srem(user_key, feed_id)
-            await pipe.execute()
+            _queue_engagement_reads(pipe=pipe, user_id=user_id, feed_id=feed_id, is_comment=is_comment)
+            results = await pipe.execute()
 
-        return await self.get_engagement(user_id=user_id, feed_id=feed_id)
+        return _parse_engagement(results[2:])
 
     async def get_engagement(self, user_id: str, feed_id: str, is_comment: bool = False):
-        engagement_keys = ["comments", "reposts", "quotes", "likes", "views", "bookmarks"]
-        interaction_keys = ["reposted", "quoted", "liked", "viewed", "bookmarked"]
-
-        prefix = "comments" if is_comment else "feeds"
-
         async with self.cache_redis.pipeline() as pipe:
-            for key in engagement_keys:
-                pipe.scard(f"{prefix}:{feed_id}:{key}")
-
-            for key in engagement_keys[1:]:
-                pipe.sismember(f"{prefix}:{feed_id}:{key}", user_id)
-
+            _queue_engagement_reads(pipe=pipe, user_id=user_id, feed_id=feed_id, is_comment=is_comment)
             results = await pipe.execute()
 
-        engagement = {}
-        num_engagement_keys = len(engagement_keys)
-        engagement_values = results[:num_engagement_keys]
-        engagement.update({key: value for key, value in zip(engagement_keys, engagement_values) if value > 0})
+        return _parse_engagement(results)
 
-        interaction_results = results[num_engagement_keys:]
-        engagement.update({interaction_key: True for interaction_key, interacted in zip(interaction_keys, interaction_results) if interacted})
+    async def get_engagements(self, user_id: str, feed_ids: list[str], is_comment: bool = False) -> list[dict]:
+        async with self.cache_redis.pipeline(transaction=False) as pipe:
+            for feed_id in feed_ids:
+                _queue_engagement_reads(pipe=pipe, user_id=user_id, feed_id=feed_id, is_comment=is_comment)
+            results = await pipe.execute()
 
-        return engagement
+        size = len(_ENGAGEMENT_KEYS) + len(_INTERACTION_KEYS)
+        return [_parse_engagement(results[index * size:(index + 1) * size]) for index in range(len(feed_ids))]
 
     ''' ********************************************* USER ********************************************* '''
 
@@ -795,6 +887,9 @@ class CacheManager:
     async def get_users_from_feeds(self) -> set[str]:
         return await self.cache_redis.smembers("feeds:online")
 
+    async def get_online_followers(self, user_id: str) -> set[str]:
+        return await self.cache_redis.sinter(f"users:{user_id}:followers", "feeds:online")
+
 
 def _scores_getter(stats: dict[str, int]) -> tuple[int, int, int, int, int, int]:
     return stats.get("comments", 0), stats.get("reposts", 0), stats.get("quotes", 0), stats.get("likes", 0), stats.get("views", 0), stats.get("bookmarks", 0)
@@ -870,6 +965,36 @@ def _parse_statistics(statistics: dict[str, int]) -> StatisticsSchema:
     return StatisticsSchema(weekly=weekly, monthly=monthly_totals, yearly=yearly_totals, total=total_count)
 
 
+def _flat_to_dict(flat: list | dict) -> dict:
+    return dict(zip(flat[::2], flat[1::2])) if isinstance(flat, list) else {}
+
+
+_FEED_TIMESTAMP_FIELDS = ("created_at", "updated_at", "scheduled_at")
+# Hash values are flat strings, so nested FeedSchema fields are stored as JSON and decoded in _get_feeds
+_FEED_JSON_FIELDS = ("category", "tags")
+_FEED_FIELDS = frozenset(FeedSchema.model_fields)
+_ENGAGEMENT_KEYS = ("comments", "reposts", "quotes", "likes", "views", "bookmarks")
+_INTERACTION_KEYS = ("reposted", "quoted", "liked", "viewed", "bookmarked")
+
+
+def _encode_feed_hash(mapping: dict) -> dict:
+    return {key: orjson.dumps(value).decode() if isinstance(value, (dict, list)) else value for key, value in mapping.items()}
+
+
+def _queue_engagement_reads(pipe: Pipeline, user_id: str, feed_id: str, is_comment: bool):
+    prefix = "comments" if is_comment else "feeds"
+    for key in _ENGAGEMENT_KEYS:
+        pipe.scard(f"{prefix}:{feed_id}:{key}")
+    for key in _ENGAGEMENT_KEYS[1:]:
+        pipe.sismember(f"{prefix}:{feed_id}:{key}", user_id)
+
+
+def _parse_engagement(results: list) -> dict:
+    engagement = {key: value for key, value in zip(_ENGAGEMENT_KEYS, results) if value > 0}
+    engagement.update({key: True for key, interacted in zip(_INTERACTION_KEYS, results[len(_ENGAGEMENT_KEYS):]) if interacted})
+    return engagement
+
+
 def _engagement_keys(feed_id: str, user_id: str, engagement_type: EngagementType, is_comment: bool):
     prefix = "comments" if is_comment else "feeds"
     engagement_key = f"{prefix}:{feed_id}:{engagement_type.value}"
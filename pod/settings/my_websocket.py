@@ -2,8 +2,9 @@ import asyncio
 import json
 import time
 from asyncio import Task
-from typing import Optional, Callable, Awaitable
+from typing import Optional, Callable, Awaitable, Mapping
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 from redis.asyncio import Redis
@@ -42,7 +43,7 @@ class WebSocketManager:
 
             if user_id:
                 self.authorized_connections[user_id] = websocket
-                my_logger.debug(f"User {user_id} connected")
+                my_logger.debug("User {} connected", user_id)
             else:
                 self.unauthorized_connections.append(websocket)
                 my_logger.debug("Anonymous WebSocket connected")
@@ -54,7 +55,7 @@ class WebSocketManager:
         try:
             if user_id:
                 self.authorized_connections.pop(user_id, None)
-                my_logger.debug(f"User with {user_id} ID disconnected")
+                my_logger.debug("User with {} ID disconnected", user_id)
             elif websocket:
                 self.unauthorized_connections.remove(websocket)
                 my_logger.debug("Anonymous WebSocket disconnected")
@@ -75,15 +76,26 @@ class WebSocketManager:
             raise ValueError(f"Exception while sending personal message: {exception}")
 
     async def broadcast(self, data: dict, user_ids: Optional[list[str]] = None):
-        targets = [self.authorized_connections[uid] for uid in user_ids if uid in self.authorized_connections] if user_ids else self.unauthorized_connections
+        await self.broadcast_text(payload=json.dumps(data), user_ids=user_ids)
 
-        async def safe_send(ws: WebSocket):
+    async def broadcast_text(self, payload: str, user_ids: Optional[list[str]] = None, batch_size: int = 50):
+        if user_ids:
+            targets = [(uid, self.authorized_connections[uid]) for uid in user_ids if uid in self.authorized_connections]
+        else:
+            targets = [(None, ws) for ws in self.unauthorized_connections]
+
+        for index, (uid, ws) in enumerate(targets, start=1):
+            if ws.client_state != WebSocketState.CONNECTED:
+                await self.disconnect(websocket=ws, user_id=uid)
+                continue
             try:
-                await ws.send_json(data=data)
+                await ws.send_text(data=payload)
             except Exception as exception:
-                print(f"🌋 Exception while broadcasting with safe_send: {exception}")
-
-        await asyncio.gather(*(safe_send(ws) for ws in targets))
+                my_logger.warning(f"🌋 Exception while broadcasting, dropping connection: {exception}")
+                await self.disconnect(websocket=ws, user_id=uid)
+            # Hand control back to the event loop so a large fan-out doesn't stall other requests
+            if index % batch_size == 0:
+                await asyncio.sleep(0)
 
 
 class WebSocketContextManager:
@@ -93,7 +105,7 @@ class WebSocketContextManager:
             connect_handler: Callable[[str, WebSocket], Awaitable[None]],
             disconnect_handler: Callable[[str, WebSocket], Awaitable[None]],
             pubsub_generator: Callable[[str], Awaitable[PubSub]],
-            message_handlers: dict[ChatEvent, Callable[[str, dict], Awaitable[None]]],
+            message_handlers: Mapping[ChatEvent, Callable[[str, dict], Awaitable[None]]],
             user_id: Optional[str] = None,
     ):
         self.websocket = websocket
@@ -154,20 +166,19 @@ class WebSocketContextManager:
     async def _pubsub_listener(self):
         """Listen to Redis pub/sub messages and dispatch them to registered handlers."""
         try:
-            async for message in self.pubsub.listen():
-                if message.get("type") != "message":
+            while True:
+                # Subscribe confirmations are dropped inside redis-py; the timeout only bounds how long one call blocks
+                message: Optional[dict] = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is None or message["type"] != "message":
                     continue
 
-                pubsub_data = message.get("data")
-                my_logger.warning(f"pubsub_data in (async for message in self.pubsub.listen()) in (_pubsub_listener): {pubsub_data}, type: {type(pubsub_data)}")
+                pubsub_data = message["data"]
                 if pubsub_data is None:
                     continue
 
                 try:
-                    if isinstance(pubsub_data, bytes):
-                        pubsub_data: str = pubsub_data.decode("utf-8")
-                    data: dict = json.loads(pubsub_data)
-                except (TypeError, json.JSONDecodeError, UnicodeDecodeError) as e:
+                    data: dict = orjson.loads(pubsub_data)
+                except (TypeError, orjson.JSONDecodeError) as e:
                     my_logger.error(f"Failed to decode pubsub message: {e}")
                     continue
 
@@ -0,0 +1,66 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from apps.feeds_app import routes
+from utility.my_enums import CommentPolicy, FeedVisibility
+
+
+class ChangedFieldsTest(unittest.TestCase):
+    def test_keeps_only_set_and_different_values(self):
+        feed = SimpleNamespace(body="hello", feed_visibility=FeedVisibility.public, comment_policy=CommentPolicy.everyone)
+
+        changes = routes._changed_fields(feed=feed, body="hello", feed_visibility=FeedVisibility.followers, comment_policy=None)
+
+        self.assertEqual(changes, {"feed_visibility": FeedVisibility.followers})
+
+    def test_nothing_changed(self):
+        feed = SimpleNamespace(body="hello")
+
+        self.assertEqual(routes._changed_fields(feed=feed, body="hello"), {})
+
+
+class SaveFeedMediaTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.remove = AsyncMock()
+        patcher = patch.object(routes, "remove_objects_from_minio", self.remove)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_no_files(self):
+        self.assertEqual(await routes._save_feed_media(user_id="u", image_file=None, video_file=None), ({}, False))
+
+    async def test_both_uploads_succeed(self):
+        with patch.object(routes, "validate_and_save_image", AsyncMock(return_value="image.png")), \
+                patch.object(routes, "validate_and_save_video", AsyncMock(return_value=("video.mp4", True))):
+            media, needs_faststart = await routes._save_feed_media(user_id="u", image_file=object(), video_file=object())
+
+        self.assertEqual(media, {"image_url": "image.png", "video_url": "video.mp4"})
+        self.assertTrue(needs_faststart)
+        self.remove.assert_not_awaited()
+
+    async def test_failed_image_removes_stored_video(self):
+        error = ValueError("image upload failed")
+        with patch.object(routes, "validate_and_save_image", AsyncMock(side_effect=error)), \
+                patch.object(routes, "validate_and_save_video", AsyncMock(return_value=("video.mp4", False))):
+            with self.assertRaises(ValueError) as raised:
+                await routes._save_feed_media(user_id="u", image_file=object(), video_file=object())
+
+        self.assertIs(raised.exception, error)
+        self.remove.assert_awaited_once_with(object_names=["video.mp4"])
+
+    async def test_failed_video_removes_stored_image(self):
+        with patch.object(routes, "validate_and_save_image", AsyncMock(return_value="image.png")), \
+                patch.object(routes, "validate_and_save_video", AsyncMock(side_effect=ValueError("video upload failed"))):
+            with self.assertRaises(ValueError):
+                await routes._save_feed_media(user_id="u", image_file=object(), video_file=object())
+
+        self.remove.assert_awaited_once_with(object_names=["image.png"])
+
+    async def test_both_failed_removes_nothing(self):
+        with patch.object(routes, "validate_and_save_image", AsyncMock(side_effect=ValueError("image"))), \
+                patch.object(routes, "validate_and_save_video", AsyncMock(side_effect=ValueError("video"))):
+            with self.assertRaises(ValueError):
+                await routes._save_feed_media(user_id="u", image_file=object(), video_file=object())
+
+        self.remove.assert_not_awaited()
@@ -0,0 +1,37 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from utility.validators import is_faststart_mp4
+
+
+def box(box_type: bytes, payload: bytes = b"") -> bytes:
+    return struct.pack(">I", 8 + len(payload)) + box_type + payload
+
+
+class IsFaststartMp4Test(unittest.TestCase):
+    def check(self, data: bytes) -> bool:
+        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as file:
+            file.write(data)
+        self.addCleanup(os.unlink, file.name)
+        return is_faststart_mp4(file.name)
+
+    def test_moov_before_mdat(self):
+        self.assertTrue(self.check(box(b"ftyp", b"isom0000") + box(b"moov", b"x" * 16) + box(b"mdat", b"y" * 32)))
+
+    def test_moov_after_mdat(self):
+        self.assertFalse(self.check(box(b"ftyp", b"isom0000") + box(b"mdat", b"y" * 32) + box(b"moov", b"x" * 16)))
+
+    def test_largesize_box_is_skipped(self):
+        free = struct.pack(">I", 1) + b"free" + struct.pack(">Q", 24) + b"z" * 8
+        self.assertTrue(self.check(free + box(b"moov")))
+
+    def test_truncated_header(self):
+        self.assertFalse(self.check(box(b"ftyp", b"isom0000") + b"\x00\x00\x00"))
+
+    def test_undersized_box(self):
+        self.assertFalse(self.check(struct.pack(">I", 4) + b"free" + box(b"moov")))
+
+    def test_undersized_largesize_box(self):
+        self.assertFalse(self.check(struct.pack(">I", 1) + b"free" + struct.pack(">Q", 8) + box(b"moov")))
@@ -1,6 +1,8 @@
 import time
 from typing import Any, Awaitable, Callable
 
+from utility.my_logger import my_logger
+
 
 async def measure_time(callback: Callable[[], Awaitable[Any]]) -> Any:
     starting_time = time.perf_counter()
@@ -8,6 +10,6 @@ async def measure_time(callback: Callable[[], Awaitable[Any]]) -> Any:
     ending_time = time.perf_counter()
 
     time_taken = ending_time - starting_time
-    print(f"⌛️ Result: {result}, Time Taken: {time_taken:.2f} seconds")
+    my_logger.debug("Result: {}, Time Taken: {:.2f} seconds", result, time_taken)
 
     return result
@@ -41,4 +41,5 @@ def custom_log_sink(message):
 
 
 my_logger.remove()
-my_logger.add(custom_log_sink, level="TRACE")
+# enqueue hands records to a background thread, so writing to stdout never blocks the event loop
+my_logger.add(custom_log_sink, level="TRACE", enqueue=True)
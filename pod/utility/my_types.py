@@ -1,4 +1,21 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import BaseModel, PlainSerializer
+
+
+def uuid_hex(value: UUID) -> str:
+    return value.hex
+
+
+def datetime_timestamp(value: datetime) -> int:
+    return int(value.timestamp())
+
+
+# Shared JSON-mode serializers: UUID -> hex, datetime -> int timestamp (python-mode dumps keep the objects)
+HexUUID = Annotated[UUID, PlainSerializer(uuid_hex, return_type=str, when_used="json")]
+UnixTs = Annotated[datetime, PlainSerializer(datetime_timestamp, return_type=int, when_used="json")]
 
 
 class StatisticsSchema(BaseModel):
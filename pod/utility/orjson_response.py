@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+
+def orjson_default(value: Any) -> Any:
+    """datetime -> int timestamp, like our schemas. orjson writes UUIDs itself (dashed) and never calls this, so callers pass .hex strings."""
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def orjson_dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+
+
+class ORJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
@@ -8,18 +8,19 @@ from uuid import UUID
 import aiohttp
 from modern_colorthief import get_color
 from PIL import Image
+from settings.my_http import get_http_session
 from settings.my_minio import put_object_to_minio
 from utility.my_logger import my_logger
 
 
 async def get_dominant_color(image_url: str) -> Optional[str]:
-    print(f"🚧 image_url: {image_url}")
+    my_logger.debug("image_url: {}", image_url)
     try:
         # Download image or fetch it from MinIO
         image_data, _ = await download_image(image_url=image_url)
 
         if not image_data:
-            print("🌋 No image data found.")
+            my_logger.error("No image data found.")
             return None
 
         # Prepare image data and extract dominant color
@@ -30,40 +31,39 @@ async def get_dominant_color(image_url: str) -> Optional[str]:
                 return "#{:02x}{:02x}{:02x}".format(*dominant_color_rgb)
         return None
     except Exception as e:
-        print(f"🌋 Exception in get_dominant_color: {e}")
+        my_logger.exception("Exception in get_dominant_color: {}", e)
         return None
 
 
 async def download_image(image_url: str) -> tuple[bytes, str]:
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(image_url, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                if response.status != 200:
-                    raise ValueError(f"Failed to download image from {image_url}")
-                image_data = await response.read()
-
-                print(f"🔨 1 Uploading image of size {len(image_data)} bytes to MinIO.")
-                if not image_data:
-                    raise ValueError("Downloaded image is empty.")
-
-                # Detect image format
-                image_stream = BytesIO(image_data)
-                try:
-                    with Image.open(image_stream) as img:
-                        extension = img.format.lower() if img.format else ""
-                except Exception as e:
-                    raise ValueError(f"Couldn't get image extension. {e}")
-
-                return image_data, extension
+        async with get_http_session().get(image_url, timeout=aiohttp.ClientTimeout(total=60)) as response:
+            if response.status != 200:
+                raise ValueError(f"Failed to download image from {image_url}")
+            image_data = await response.read()
+
+            my_logger.debug("1 Uploading image of size {} bytes to MinIO.", len(image_data))
+            if not image_data:
+                raise ValueError("Downloaded image is empty.")
+
+            # Detect image format
+            image_stream = BytesIO(image_data)
+            try:
+                with Image.open(image_stream) as img:
+                    extension = img.format.lower() if img.format else ""
+            except Exception as e:
+                raise ValueError(f"Couldn't get image extension. {e}")
+
+            return image_data, extension
     except Exception as e:
-        print(f"🌋 Exception in download_image: {e}")
+        my_logger.exception("Exception in download_image: {}", e)
         raise Exception("🌋 Exception in download_imag")
 
 
 async def prepare_image_data(image_data: bytes, max_width: int = 72, max_height: int = 72) -> BytesIO:
     try:
         # Open the image using BytesIO
-        print(f"🔨 2 Uploading image of size {len(image_data)} bytes to MinIO.")
+        my_logger.debug("2 Uploading image of size {} bytes to MinIO.", len(image_data))
         image_stream = BytesIO(image_data)
         pil_image = Image.open(image_stream)
 
@@ -82,7 +82,7 @@ async def prepare_image_data(image_data: bytes, max_width: int = 72, max_height:
 
         return output_image
     except Exception as e:
-        print(f"🌋 Exception in prepare_image_data: {e}")
+        my_logger.exception("Exception in prepare_image_data: {}", e)
         raise ValueError(f"🌋 Exception in prepare_image_data: {e}")
 
 
@@ -97,22 +97,22 @@ def generate_password_string() -> str:
 
 
 async def generate_avatar_url(user_id: UUID, image_url: str) -> Optional[str]:
-    print(f"🚧 image_url: {image_url}, user_id: {user_id}")
+    my_logger.debug("image_url: {}, user_id: {}", image_url, user_id)
 
     try:
         image_data, extension = await download_image(image_url=image_url)
-        my_logger.debug(f"generate_avatar_url image_data, extension : _, {extension}")
+        my_logger.debug("generate_avatar_url image_data, extension : _, {}", extension)
         if image_data:
             image_stream: BytesIO = await prepare_image_data(image_data=image_data)
             image_data: bytes = image_stream.read()
             if image_data:
-                print(f"🔨 3 Uploading image of size {len(image_data)} bytes to MinIO.")
-                print(f"🔨 4 Uploading image of size {len(image_stream.getbuffer())} bytes to MinIO.")
+                my_logger.debug("3 Uploading image of size {} bytes to MinIO.", len(image_data))
+                my_logger.debug("4 Uploading image of size {} bytes to MinIO.", len(image_stream.getbuffer()))
                 uploaded_object = await put_object_to_minio(object_name=f"users/{user_id.hex}/avatar.{extension}", data=image_data)
                 if uploaded_object:
-                    print(f"✅ Successfully uploaded image to MinIO: {uploaded_object}")
+                    my_logger.debug("Successfully uploaded image to MinIO: {}", uploaded_object)
                 return uploaded_object
         return None
     except Exception as e:
-        print(f"🌋 Exception in generate_avatar_url: {e}")
+        my_logger.exception("Exception in generate_avatar_url: {}", e)
         raise ValueError(f"🌋 Exception in generate_avatar_url: {e}")
@@ -1,6 +1,6 @@
+import asyncio
 import json
 import re
-import subprocess
 import uuid
 from datetime import datetime
 from io import BytesIO
@@ -16,8 +16,8 @@ from settings.my_exceptions import ValidationException
 email_regex = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
 violent_words = ["sex", "sexy", "sexual", "nude", "porn", "pornography", "nudes", "nudity"]
 violent_words_regex = r"(" + "|".join(re.escape(word) for word in violent_words) + r")"
-allowed_image_extension = {"png", "jpg", "jpeg"}
-allowed_video_extension = {"mp4", "mov"}
+allowed_image_extension = frozenset({"png", "jpg", "jpeg"})
+allowed_video_extension = frozenset({"mp4", "mov"})
 
 
 def validate_username(username: Optional[str] = None) -> None:
@@ -86,8 +86,11 @@ async def get_video_duration(file_path: str) -> float:
 
 
 async def get_video_duration_using_ffprobe(file_path: str) -> float:
-    result = subprocess.run(args=["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", file_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    output = json.loads(result.stdout)
+    process = await asyncio.create_subprocess_exec(
+        "ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", file_path, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+    )
+    stdout, _ = await process.communicate()
+    output = json.loads(stdout)
     return float(output["format"]["duration"])
 
 
@@ -97,6 +100,28 @@ async def get_video_duration_using_mediainfo(file_path: str) -> float:
     return video_track.duration
 
 
+def is_faststart_mp4(file_path: str) -> bool:
+    """Walk the top-level MP4/MOV boxes and report whether "moov" comes before "mdat"."""
+    with open(file_path, "rb") as file:
+        while header := file.read(8):
+            if len(header) < 8:
+                return False
+            size, box_type = int.from_bytes(header[:4], "big"), header[4:]
+            if box_type == b"moov":
+                return True
+            if box_type == b"mdat":
+                return False
+            if size == 1:
+                size = int.from_bytes(file.read(8), "big") - 8
+            elif size == 0:
+                return False
+            # A box can never be smaller than its own header; a corrupt size would seek backwards or loop forever
+            if size < 8:
+                return False
+            file.seek(size - 8, 1)
+    return False
+
+
 def get_image_dimensions(image_bytes: bytes) -> tuple[int, int]:
     try:
         image: ImageFile = Image.open(fp=BytesIO(image_bytes))